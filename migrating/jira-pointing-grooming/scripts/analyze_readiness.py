@@ -12,6 +12,11 @@ Usage:
     uv run analyze_readiness.py FSEC-1234
     uv run analyze_readiness.py FSEC-1234 --verbose
     uv run analyze_readiness.py FSEC-1234 --json
+    uv run analyze_readiness.py FSEC-1234 --no-cache
+
+Reports are cached in ~/.cache/jira_readiness/reports.sqlite, keyed by the
+ticket key and its `updated` timestamp, so re-running on an unchanged ticket
+only fetches that one field and skips the analysis.
 
 Environment variables:
     JIRA_URL: Jira instance URL (defaults to https://zendesk.atlassian.net)
@@ -31,12 +36,18 @@ import os
 import sys
 import json
 import re
+import sqlite3
+from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 import click
 from atlassian import Jira
 
 
+# Given/When/Then words, searched in order by _has_given_when_then
+GWT_WORD_RES = [re.compile(rf'\b{word}\b') for word in ('given', 'when', 'then')]
+
+
 @dataclass
 class Gap:
     """Represents a detected gap in ticket readiness."""
@@ -67,6 +78,80 @@ class ReadinessReport:
     ready_for_pointing: bool = False
 
 
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'jira_readiness' / 'reports.sqlite'
+
+
+class ReportCache:
+    """On-disk cache of readiness reports keyed by (issue_key, updated).
+
+    A report is a pure function of the fetched ticket, so a cached row stays
+    valid until Jira bumps the ticket's `updated` timestamp. Bump
+    SCHEMA_VERSION whenever the analysis rules change so stale reports are
+    discarded.
+
+    The cache is only an optimization: SQLite or filesystem errors in `get`
+    and `put` are reported as warnings and treated as a miss / skipped write,
+    and rows that no longer decode into a report are treated as a miss.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+            self.conn.execute('DROP TABLE IF EXISTS reports')
+            self.conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS reports '
+            '(key TEXT, updated TEXT, json BLOB, PRIMARY KEY(key, updated))'
+        )
+        self.conn.commit()
+
+    @classmethod
+    def open(cls, path: Path = DEFAULT_CACHE_PATH) -> Optional['ReportCache']:
+        """Open the cache, or return None (with a warning) if it is unusable."""
+        try:
+            return cls(path)
+        except (sqlite3.Error, OSError) as e:
+            click.echo(f"⚠️  Report cache unavailable, continuing without it: {e}", err=True)
+            return None
+
+    def get(self, issue_key: str, updated: str) -> Optional[ReadinessReport]:
+        """Return the cached report for this ticket version, if any."""
+        try:
+            row = self.conn.execute(
+                'SELECT json FROM reports WHERE key = ? AND updated = ?',
+                (issue_key, updated)
+            ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            click.echo(f"⚠️  Report cache read failed: {e}", err=True)
+            return None
+        if row is None:
+            return None
+
+        # A corrupt row, or one written by an incompatible version of the
+        # report dataclasses, is just a miss
+        try:
+            data = json.loads(row[0])
+            data['gaps'] = [Gap(**g) for g in data['gaps']]
+            return ReadinessReport(**data)
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def put(self, updated: str, report: ReadinessReport) -> None:
+        """Store a report, replacing older versions of the same ticket."""
+        try:
+            with self.conn:
+                self.conn.execute('DELETE FROM reports WHERE key = ?', (report.issue_key,))
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO reports (key, updated, json) VALUES (?, ?, ?)',
+                    (report.issue_key, updated, json.dumps(asdict(report)))
+                )
+        except (sqlite3.Error, OSError) as e:
+            click.echo(f"⚠️  Report cache write failed: {e}", err=True)
+
+
 class ReadinessAnalyzer:
     """Analyzes Jira tickets for pointing readiness."""
 
@@ -83,12 +168,31 @@ class ReadinessAnalyzer:
     SECURITY_KEYWORDS = ['password', 'token', 'auth', 'permission', 'pii',
                         'gdpr', 'encryption', 'security']
 
-    def __init__(self, jira_client: Jira):
+    def __init__(self, jira_client: Jira, cache: Optional[ReportCache] = None):
         self.client = jira_client
+        self.cache = cache
 
     def analyze(self, issue_key: str) -> ReadinessReport:
-        """Analyze a ticket and return readiness report."""
-        issue = self.client.issue(issue_key)
+        """Analyze a ticket and return readiness report.
+
+        With a cache configured, only the `updated` field is fetched first and a
+        cached report for that ticket version is returned without re-analysis.
+        """
+        if self.cache is None:
+            return self._analyze_issue(issue_key, self.client.issue(issue_key))
+
+        updated = self.client.issue(issue_key, fields='updated')['fields'].get('updated') or ''
+        report = self.cache.get(issue_key, updated)
+        if report is None:
+            issue = self.client.issue(issue_key)
+            report = self._analyze_issue(issue_key, issue)
+            # Store under the timestamp of the full fetch in case the ticket
+            # changed between the two requests
+            self.cache.put(issue['fields'].get('updated') or updated, report)
+        return report
+
+    def _analyze_issue(self, issue_key: str, issue: Dict[str, Any]) -> ReadinessReport:
+        """Run gap detection and scoring on a fetched issue."""
         fields = issue['fields']
 
         # Extract key fields
@@ -102,21 +206,25 @@ class ReadinessAnalyzer:
         if 'comment' in fields and 'comments' in fields['comment']:
             comments = [c.get('body', '') for c in fields['comment']['comments']]
 
-        # Combine all text for analysis
+        # Combine all text for analysis. Each part is lowercased exactly once and
+        # the lowercase description is shared with the description-only checks,
+        # so no checker re-scans or re-lowers text another one already has.
         all_text = f"{summary}\n{description}\n" + "\n".join(comments)
+        desc_lower = description.lower()
+        all_lower = f"{summary.lower()}\n{desc_lower}\n" + "\n".join(c.lower() for c in comments)
 
         # Run gap detection
         gaps = []
-        gaps.extend(self._check_acceptance_criteria(description, issue_type))
-        gaps.extend(self._check_vague_language(all_text))
-        gaps.extend(self._check_technical_context(description, issue_type))
+        gaps.extend(self._check_acceptance_criteria(desc_lower, issue_type))
+        gaps.extend(self._check_vague_language(all_text, all_lower))
+        gaps.extend(self._check_technical_context(desc_lower, issue_type))
         gaps.extend(self._check_dependencies(all_text, issue))
-        gaps.extend(self._check_test_scenarios(all_text, issue_type))
+        gaps.extend(self._check_test_scenarios(all_lower, issue_type))
         gaps.extend(self._check_scope_creep(comments))
-        gaps.extend(self._check_security_context(all_text))
+        gaps.extend(self._check_security_context(all_lower))
 
         # Identify strengths
-        strengths = self._identify_strengths(description, all_text, issue)
+        strengths = self._identify_strengths(desc_lower, len(description), all_lower, issue)
 
         # Calculate scores
         req_score = self._calculate_requirements_score(gaps)
@@ -143,20 +251,19 @@ class ReadinessAnalyzer:
             ready_for_pointing=ready
         )
 
-    def _check_acceptance_criteria(self, description: str, issue_type: str) -> List[Gap]:
-        """Check for acceptance criteria."""
+    def _check_acceptance_criteria(self, desc_lower: str, issue_type: str) -> List[Gap]:
+        """Check for acceptance criteria in the lowercased description."""
         gaps = []
-        desc_lower = description.lower()
 
         # Check for AC keywords
         has_ac_section = any(kw in desc_lower for kw in self.AC_KEYWORDS)
 
         # Check for Given/When/Then format
-        has_gwt_format = bool(re.search(r'\bgiven\b.*\bwhen\b.*\bthen\b', desc_lower, re.DOTALL))
+        has_gwt_format = self._has_given_when_then(desc_lower)
 
         # Check for checkboxes or bullets
-        has_criteria_list = bool(re.search(r'[-*•]\s*\[', description)) or \
-                           bool(re.search(r'^\s*[-*•]\s+', description, re.MULTILINE))
+        has_criteria_list = bool(re.search(r'[-*•]\s*\[', desc_lower)) or \
+                           bool(re.search(r'^\s*[-*•]\s+', desc_lower, re.MULTILINE))
 
         if not (has_ac_section or has_gwt_format or has_criteria_list):
             if issue_type.lower() not in ['bug', 'incident', 'hotfix']:
@@ -179,10 +286,26 @@ class ReadinessAnalyzer:
 
         return gaps
 
-    def _check_vague_language(self, text: str) -> List[Gap]:
+    @staticmethod
+    def _has_given_when_then(desc_lower: str) -> bool:
+        """Check that "given", "when" and "then" appear as words, in that order.
+
+        Each word is located with one forward search starting after the previous
+        match, so the scan is linear in the description length. A single
+        ``given.*when.*then`` regex backtracks quadratically on descriptions with
+        many "given"/"when" candidates and no trailing "then".
+        """
+        pos = 0
+        for word_re in GWT_WORD_RES:
+            match = word_re.search(desc_lower, pos)
+            if not match:
+                return False
+            pos = match.end()
+        return True
+
+    def _check_vague_language(self, text: str, text_lower: str) -> List[Gap]:
         """Check for vague or ambiguous language."""
         gaps = []
-        text_lower = text.lower()
 
         found_vague = []
         for word in self.VAGUE_WORDS:
@@ -219,14 +342,13 @@ class ReadinessAnalyzer:
 
         return gaps
 
-    def _check_technical_context(self, description: str, issue_type: str) -> List[Gap]:
+    def _check_technical_context(self, desc_lower: str, issue_type: str) -> List[Gap]:
         """Check for technical context and approach."""
         gaps = []
 
         if issue_type.lower() in ['bug', 'incident', 'hotfix']:
             return gaps  # Bugs often don't need upfront technical design
 
-        desc_lower = description.lower()
         has_tech_keywords = any(kw in desc_lower for kw in self.TECH_KEYWORDS)
         has_tech_section = 'technical' in desc_lower and ('approach' in desc_lower or
                                                           'design' in desc_lower or
@@ -290,11 +412,10 @@ class ReadinessAnalyzer:
 
         return gaps
 
-    def _check_test_scenarios(self, text: str, issue_type: str) -> List[Gap]:
+    def _check_test_scenarios(self, text_lower: str, issue_type: str) -> List[Gap]:
         """Check for test scenarios."""
         gaps = []
 
-        text_lower = text.lower()
         has_test_keywords = any(kw in text_lower for kw in self.TEST_KEYWORDS)
         has_test_section = 'test' in text_lower and ('scenario' in text_lower or
                                                      'case' in text_lower or
@@ -354,11 +475,10 @@ class ReadinessAnalyzer:
 
         return gaps
 
-    def _check_security_context(self, text: str) -> List[Gap]:
+    def _check_security_context(self, text_lower: str) -> List[Gap]:
         """Check for security context where needed."""
         gaps = []
 
-        text_lower = text.lower()
         has_security_keywords = any(kw in text_lower for kw in self.SECURITY_KEYWORDS)
         has_security_section = 'security' in text_lower or 'compliance' in text_lower
 
@@ -384,25 +504,26 @@ class ReadinessAnalyzer:
 
         return gaps
 
-    def _identify_strengths(self, description: str, all_text: str, issue: Dict[str, Any]) -> List[str]:
+    def _identify_strengths(self, desc_lower: str, desc_len: int, all_lower: str,
+                            issue: Dict[str, Any]) -> List[str]:
         """Identify positive aspects of the ticket."""
         strengths = []
 
         # Check for good practices
-        if any(kw in description.lower() for kw in self.AC_KEYWORDS):
+        if any(kw in desc_lower for kw in self.AC_KEYWORDS):
             strengths.append('Has acceptance criteria')
 
-        if any(kw in all_text.lower() for kw in self.TEST_KEYWORDS):
+        if any(kw in all_lower for kw in self.TEST_KEYWORDS):
             strengths.append('Test scenarios discussed')
 
-        if any(kw in description.lower() for kw in self.TECH_KEYWORDS):
+        if any(kw in desc_lower for kw in self.TECH_KEYWORDS):
             strengths.append('Technical context provided')
 
         fields = issue.get('fields', {})
         if fields.get('issuelinks'):
             strengths.append('Dependencies linked')
 
-        if len(description) > 200:
+        if desc_len > 200:
             strengths.append('Detailed description')
 
         return strengths
@@ -559,11 +680,13 @@ def format_report(report: ReadinessReport, verbose: bool = False) -> str:
 @click.argument('issue_key')
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed questions and actions')
 @click.option('--json-output', '--json', is_flag=True, help='Output as JSON')
-def main(issue_key: str, verbose: bool, json_output: bool):
+@click.option('--no-cache', is_flag=True, help='Always re-fetch and re-analyze the ticket')
+def main(issue_key: str, verbose: bool, json_output: bool, no_cache: bool):
     """Analyze a Jira ticket for pointing readiness."""
     try:
         client = get_jira_client()
-        analyzer = ReadinessAnalyzer(client)
+        cache = None if no_cache else ReportCache.open()
+        analyzer = ReadinessAnalyzer(client, cache=cache)
 
         click.echo(f"Analyzing {issue_key}...", err=True)
         report = analyzer.analyze(issue_key)
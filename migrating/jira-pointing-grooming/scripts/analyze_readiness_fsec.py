@@ -16,6 +16,7 @@ Usage:
     uv run analyze_readiness_fsec.py FSEC-1234
     uv run analyze_readiness_fsec.py FSEC-1234 --verbose
     uv run analyze_readiness_fsec.py FSEC-1234 --json
+    uv run analyze_readiness_fsec.py --keys FSEC-1234,FSEC-1235,FSEC-1236
 
 Environment variables:
     JIRA_URL: Jira instance URL (defaults to https://zendesk.atlassian.net)
@@ -24,23 +25,101 @@ Environment variables:
 """
 
 # /// script
+# requires-python = ">=3.10"
 # dependencies = [
 #   "atlassian-python-api>=4.0.3",
 #   "click>=8.1.7",
+#   "orjson>=3.9.0",
+#   "pyahocorasick>=2.0.0",
 # ]
 # ///
 
+import io
 import os
 import sys
-import json
 import re
-from typing import Dict, Any, List
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Dict, Any, List, NamedTuple, Optional, Set, Tuple
+from dataclasses import dataclass, field, asdict
+import ahocorasick
 import click
-from atlassian import Jira
+import orjson
 
+if TYPE_CHECKING:
+    # Imported lazily in get_jira_client; it dominates CLI startup time
+    from atlassian import Jira
 
-@dataclass
+
+# Only the fields the analyzer reads; fetching '*all' pulls every custom field
+ANALYSIS_FIELDS = 'summary,description,issuetype,status,comment,issuelinks'
+
+# REST v2 search returns description and comment bodies as plain text. The
+# library's jql() goes to the v3 endpoint on Cloud, which returns Atlassian
+# Document Format instead.
+SEARCH_PATH = 'rest/api/2/search/jql'
+
+# Maximum number of keys per `key in (...)` search
+BATCH_SIZE = 100
+
+# Concurrent batch searches; keep modest to stay under Jira rate limits
+MAX_WORKERS = 8
+
+# Only recent comment text is scanned; the checks look for short keywords and
+# long-running tickets otherwise dominate per-ticket scan cost
+MAX_COMMENTS = 20
+MAX_COMMENT_CHARS = 4096
+
+# Jira issue key reference such as FSEC-1234
+JIRA_KEY_RE = re.compile(r'\b[A-Z]+-\d+\b')
+
+# Readiness tiers by minimum total score, highest first
+TIER_THRESHOLDS = [(80, 'EXCELLENT'), (60, 'GOOD'), (45, 'NEEDS_WORK')]
+
+# Score emoji and verdict line shown in the text report for each tier
+TIER_DISPLAY = {
+    'EXCELLENT': ("✅", "✅ EXCELLENT - Ready for pointing"),
+    'GOOD': ("⚠️", "⚠️  GOOD ENOUGH - Ready for pointing (FSEC threshold)"),
+    'NEEDS_WORK': ("❌", "❌ NEEDS WORK - Address gaps before pointing"),
+    'NOT_READY': ("❌", "❌ NOT READY - Significant gaps to address"),
+}
+
+
+def score_tier(total_score: float) -> str:
+    """Map a total FSEC score to its readiness tier."""
+    for threshold, tier in TIER_THRESHOLDS:
+        if total_score >= threshold:
+            return tier
+    return 'NOT_READY'
+
+
+def _context_snippet(text: str, start: int, end: int, width: int = 50) -> str:
+    """Return text[start:end] with up to `width` chars of same-line context."""
+    left = max(0, start - width)
+    newline = text.rfind('\n', left, start)
+    if newline != -1:
+        left = newline + 1
+
+    right = end + width
+    newline = text.find('\n', end, right)
+    if newline != -1:
+        right = newline
+
+    return text[left:right].strip()
+
+
+def _comment_text(body: Any) -> str:
+    """Return a comment body as text, capped at MAX_COMMENT_CHARS.
+
+    Jira Cloud can return Atlassian Document Format (a dict) instead of a
+    string; its JSON form still contains the words the keyword checks need.
+    """
+    if not isinstance(body, str):
+        body = orjson.dumps(body).decode() if body else ''
+    return body[:MAX_COMMENT_CHARS]
+
+
+@dataclass(slots=True)
 class Gap:
     """Represents a detected gap in ticket readiness."""
     category: str  # requirements, technical, testing, context
@@ -51,7 +130,32 @@ class Gap:
     actions: List[str] = field(default_factory=list)
 
 
-@dataclass
+class References(NamedTuple):
+    """Links to related resources found in a ticket description."""
+    github: bool  # github.com link
+    slack: bool   # slack.com link
+    jira: bool    # issue key such as FSEC-1234
+
+    @property
+    def any(self) -> bool:
+        return self.github or self.slack or self.jira
+
+
+@dataclass(slots=True)
+class Signals:
+    """Keyword and reference signals for one ticket, derived once per analysis."""
+    problem_hit: bool           # problem indicator in description
+    aws_hit: bool               # AWS keyword in description
+    impl_hit: bool              # implementation keyword in description
+    security_hit: bool          # security keyword anywhere
+    security_section_hit: bool  # security discussion anywhere
+    test_hit: bool              # testing keyword anywhere
+    refs: References            # references in description
+    desc_len: int
+    text_len: int
+
+
+@dataclass(slots=True)
 class ReadinessReport:
     """Complete readiness assessment report."""
     issue_key: str
@@ -69,6 +173,7 @@ class ReadinessReport:
     strengths: List[str] = field(default_factory=list)
     ready_for_pointing: bool = False
     mode: str = "FSEC"
+    tier: str = ''  # EXCELLENT, GOOD, NEEDS_WORK, NOT_READY
 
 
 class FSECReadinessAnalyzer:
@@ -85,13 +190,147 @@ class FSECReadinessAnalyzer:
     SECURITY_KEYWORDS = ['iam', 'policy', 'role', 'permission', 'auth', 'encryption',
                         'kms', 'security', 'compliance']
     TEST_KEYWORDS = ['test', 'verify', 'validate', 'check']
+    SECURITY_SECTION_MARKERS = ['security', 'iam policy']
+
+    # Exploratory issue types (lowercase) that skip upfront technical checks
+    SPIKE_TYPES = frozenset({'spike', 'research'})
 
-    def __init__(self, jira_client: Jira):
+    def __init__(self, jira_client: 'Jira'):
         self.client = jira_client
+        self.keyword_automaton = self._build_keyword_automaton()
+
+    def _build_keyword_automaton(self) -> ahocorasick.Automaton:
+        """Build one Aho-Corasick automaton over every keyword category.
+
+        Each keyword maps to the categories it belongs to (e.g. 'iam' is both an
+        AWS and a security keyword), so one scan finds every category's hits.
+        """
+        categories = {
+            'problem': self.PROBLEM_INDICATORS,
+            'aws': self.AWS_KEYWORDS,
+            'implementation': self.IMPLEMENTATION_KEYWORDS,
+            'security': self.SECURITY_KEYWORDS,
+            'security_section': self.SECURITY_SECTION_MARKERS,
+            'test': self.TEST_KEYWORDS,
+            # Lowercased so 'tbd' blocks estimation as much as 'TBD' does
+            'critical_vague': [marker.lower() for marker in self.CRITICAL_VAGUE],
+        }
+        keyword_categories: Dict[str, List[str]] = {}
+        for category, keywords in categories.items():
+            for kw in keywords:
+                keyword_categories.setdefault(kw, []).append(category)
+
+        automaton = ahocorasick.Automaton()
+        for kw, cats in keyword_categories.items():
+            automaton.add_word(kw, (kw, tuple(cats)))
+        automaton.make_automaton()
+        return automaton
+
+    def _scan_keywords(self, text_lower: str, desc_start: int,
+                       desc_end: int) -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]]]:
+        """Scan text once and return keyword hits per category.
+
+        Returns (hits, desc_hits): hits over the whole text, and the subset that
+        lies entirely within text_lower[desc_start:desc_end].
+        """
+        hits: Dict[str, Set[str]] = defaultdict(set)
+        desc_hits: Dict[str, Set[str]] = defaultdict(set)
+        for end, (kw, cats) in self.keyword_automaton.iter(text_lower):
+            in_description = desc_start <= end - len(kw) + 1 and end < desc_end
+            for cat in cats:
+                hits[cat].add(kw)
+                if in_description:
+                    desc_hits[cat].add(kw)
+        return hits, desc_hits
 
     def analyze(self, issue_key: str) -> ReadinessReport:
         """Analyze a ticket using FSEC-specific criteria."""
-        issue = self.client.issue(issue_key)
+        reports, missing = self.analyze_many([issue_key])
+        if missing:
+            raise ValueError(f"Issue not found: {issue_key}")
+        return reports[0]
+
+    def analyze_many(self, issue_keys: List[str]) -> Tuple[List[ReadinessReport], List[str]]:
+        """Analyze several tickets, fetching them with one JQL search per batch.
+
+        Batches are fetched concurrently so total latency approaches that of the
+        slowest search. Keys a batch did not return (moved tickets, or a batch
+        Jira rejected over a nonexistent key) are fetched one at a time.
+
+        Returns (reports, missing): reports in the same order as `issue_keys`,
+        and the keys that could not be found at all.
+        """
+        # Jira returns canonical upper-case keys; match on those
+        lookup_keys = list(dict.fromkeys(key.upper() for key in issue_keys))
+        batches = [lookup_keys[start:start + BATCH_SIZE]
+                   for start in range(0, len(lookup_keys), BATCH_SIZE)]
+
+        issues: Dict[str, Dict[str, Any]] = {}
+        if len(batches) == 1:
+            results = [self._fetch_batch(batches[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(batches))) as executor:
+                results = list(executor.map(self._fetch_batch, batches))
+        for batch_issues in results:
+            for issue in batch_issues:
+                issues[issue['key']] = issue
+
+        for key in lookup_keys:
+            if key not in issues:
+                issue = self._fetch_issue(key)
+                if issue is not None:
+                    issues[key] = issue
+
+        reports = [self._analyze_issue(key, issues[key.upper()])
+                   for key in issue_keys if key.upper() in issues]
+        missing = [key for key in issue_keys if key.upper() not in issues]
+        return reports, missing
+
+    def _fetch_batch(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """Fetch one batch of issues with a JQL search, following page tokens.
+
+        Jira rejects the whole search with a 400 if any key does not exist;
+        that batch comes back empty and its keys fall through to
+        `_fetch_issue`. Any other HTTP error is raised.
+        """
+        from requests import HTTPError
+
+        issues: List[Dict[str, Any]] = []
+        params: Dict[str, Any] = {
+            'jql': f"key in ({','.join(keys)})",
+            'fields': ANALYSIS_FIELDS,
+            'maxResults': BATCH_SIZE,
+        }
+        while True:
+            try:
+                result = self.client.get(SEARCH_PATH, params=params) or {}
+            except HTTPError as e:
+                if e.response is not None and e.response.status_code == 400:
+                    return []
+                raise
+            issues.extend(result.get('issues', []))
+            token = result.get('nextPageToken')
+            if result.get('isLast', True) or not token:
+                return issues
+            params['nextPageToken'] = token
+
+    def _fetch_issue(self, key: str) -> Optional[Dict[str, Any]]:
+        """Fetch a single issue by key, following moves; None if it does not exist."""
+        from requests import HTTPError
+
+        try:
+            return self.client.issue(key, fields=ANALYSIS_FIELDS)
+        except HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    def _analyze_issue(self, issue_key: str, issue: Dict[str, Any]) -> ReadinessReport:
+        """Run FSEC gap detection and scoring on a fetched issue.
+
+        Only the last MAX_COMMENTS comments are considered, each truncated to
+        MAX_COMMENT_CHARS characters.
+        """
         fields = issue['fields']
 
         # Extract key fields
@@ -101,30 +340,57 @@ class FSECReadinessAnalyzer:
         status = fields.get('status', {}).get('name', 'Unknown')
 
         # Get comments
-        comments = []
-        if 'comment' in fields and 'comments' in fields['comment']:
-            comments = [c.get('body', '') for c in fields['comment']['comments']]
-
-        # Combine text
-        all_text = f"{summary}\n{description}\n" + "\n".join(comments)
+        raw_comments = (fields.get('comment') or {}).get('comments', [])[-MAX_COMMENTS:]
+        comments = [_comment_text(c.get('body', '')) for c in raw_comments]
+
+        # Build the combined text and its lowercase form once; every checker
+        # shares them. The lowercase text is assembled from lowercased parts so
+        # the description offsets stay valid for the keyword scan.
+        comments_text = "\n".join(comments)
+        all_text = f"{summary}\n{description}\n{comments_text}"
+        summary_lower = summary.lower()
+        desc_lower = description.lower()
+        all_lower = f"{summary_lower}\n{desc_lower}\n{comments_text.lower()}"
+        desc_len = len(description)
+        desc_start = len(summary_lower) + 1
+        hits, desc_hits = self._scan_keywords(all_lower, desc_start, desc_start + len(desc_lower))
+
+        # Derive each signal once; checkers, strengths and scores all share them
+        is_spike = issue_type.lower() in self.SPIKE_TYPES
+        signals = Signals(
+            problem_hit=bool(desc_hits['problem']),
+            aws_hit=bool(desc_hits['aws']),
+            impl_hit=bool(desc_hits['implementation']),
+            security_hit=bool(hits['security']),
+            security_section_hit=bool(hits['security_section']),
+            test_hit=bool(hits['test']),
+            refs=References(
+                github='github.com' in description,
+                slack='slack.com' in description,
+                jira=bool(JIRA_KEY_RE.search(description)),
+            ),
+            desc_len=desc_len,
+            text_len=len(all_text),
+        )
 
         # Run FSEC-specific analysis
         gaps = []
-        gaps.extend(self._check_problem_statement(description))
-        gaps.extend(self._check_critical_ambiguity(all_text))
-        gaps.extend(self._check_aws_context(description, issue_type))
-        gaps.extend(self._check_implementation_clarity(description))
-        gaps.extend(self._check_references(description))
-        gaps.extend(self._check_security_context(all_text))
+        gaps.extend(self._check_problem_statement(description, signals))
+        gaps.extend(self._check_critical_ambiguity(all_text, all_lower, hits['critical_vague']))
+        gaps.extend(self._check_aws_context(is_spike, signals))
+        gaps.extend(self._check_implementation_clarity(signals))
+        gaps.extend(self._check_references(signals))
+        gaps.extend(self._check_security_context(signals))
 
         # Identify strengths
-        strengths = self._identify_strengths(description, all_text, issue)
+        strengths = self._identify_strengths(signals, issue)
 
         # Calculate scores using FSEC weighting
-        req_score = self._calculate_requirements_score(description, gaps)
-        tech_score = self._calculate_technical_score(description, issue, gaps)
-        ctx_score = self._calculate_context_score(description, gaps)
-        test_score = self._calculate_testing_score(all_text)
+        gap_counts = Counter((g.category, g.severity) for g in gaps)
+        req_score = self._calculate_requirements_score(gap_counts)
+        tech_score = self._calculate_technical_score(gap_counts, signals)
+        ctx_score = self._calculate_context_score(gap_counts)
+        test_score = self._calculate_testing_score(signals)
         total_score = req_score + tech_score + ctx_score + test_score
 
         # FSEC threshold: 60+ (vs standard 75+)
@@ -142,15 +408,15 @@ class FSECReadinessAnalyzer:
             total_score=total_score,
             gaps=gaps,
             strengths=strengths,
-            ready_for_pointing=ready
+            ready_for_pointing=ready,
+            tier=score_tier(total_score)
         )
 
-    def _check_problem_statement(self, description: str) -> List[Gap]:
+    def _check_problem_statement(self, description: str, signals: Signals) -> List[Gap]:
         """Check for clear problem or request."""
         gaps = []
-        desc_lower = description.lower()
 
-        has_problem = any(word in desc_lower for word in self.PROBLEM_INDICATORS)
+        has_problem = signals.problem_hit
         has_substance = len(description.strip()) > 50
 
         if not (has_problem or has_substance):
@@ -165,41 +431,54 @@ class FSECReadinessAnalyzer:
 
         return gaps
 
-    def _check_critical_ambiguity(self, text: str) -> List[Gap]:
-        """Check for CRITICAL vague language (TBD, ???) but not normal uncertainty."""
+    def _check_critical_ambiguity(self, text: str, text_lower: str,
+                                  vague_hits: Set[str]) -> List[Gap]:
+        """Check for CRITICAL vague language (TBD, ???) but not normal uncertainty.
+
+        Reports up to two distinct markers, in order of appearance, each with
+        up to 50 characters of same-line context on either side. Markers close
+        enough to share a snippet are quoted once.
+        """
         gaps = []
 
-        found_critical = []
-        for marker in self.CRITICAL_VAGUE:
-            if marker in text:
-                pattern = rf'.{{0,50}}{re.escape(marker)}.{{0,50}}'
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    found_critical.append(f'"{matches[0].strip()}"')
+        # The keyword scan already knows whether any marker is present
+        if not vague_hits:
+            return gaps
+
+        # First occurrence of each marker present, earliest first
+        first_seen = sorted((text_lower.find(marker), marker) for marker in vague_hits)
+
+        # lower() only ever lengthens text (e.g. 'İ'), so equal lengths mean the
+        # offsets line up with the original and the snippet keeps its case
+        source = text if len(text) == len(text_lower) else text_lower
+        found_critical: List[str] = []
+        for idx, marker in first_seen:
+            snippet = f'"{_context_snippet(source, idx, idx + len(marker))}"'
+            if snippet not in found_critical:
+                found_critical.append(snippet)
+                if len(found_critical) == 2:
+                    break
 
         if found_critical:
             gaps.append(Gap(
                 category='requirements',
                 severity='HIGH',
                 title='Critical Ambiguity',
-                description=f'Found blockers: {", ".join(found_critical[:2])}',
+                description=f'Found blockers: {", ".join(found_critical)}',
                 questions=['What needs to be decided before we can estimate?'],
                 actions=['Convert TBD/TODO into specific questions', 'Assign owners to open questions']
             ))
 
         return gaps
 
-    def _check_aws_context(self, description: str, issue_type: str) -> List[Gap]:
+    def _check_aws_context(self, is_spike: bool, signals: Signals) -> List[Gap]:
         """Check for AWS/infrastructure context."""
         gaps = []
 
-        if issue_type.lower() in ['spike', 'research']:
+        if is_spike:
             return gaps
 
-        desc_lower = description.lower()
-        has_aws = any(kw in desc_lower for kw in self.AWS_KEYWORDS)
-
-        if not has_aws and len(description) < 100:
+        if not signals.aws_hit and signals.desc_len < 100:
             gaps.append(Gap(
                 category='technical',
                 severity='MEDIUM',
@@ -213,13 +492,12 @@ class FSECReadinessAnalyzer:
 
         return gaps
 
-    def _check_implementation_clarity(self, description: str) -> List[Gap]:
+    def _check_implementation_clarity(self, signals: Signals) -> List[Gap]:
         """Check for clear implementation approach."""
         gaps = []
-        desc_lower = description.lower()
 
-        has_action = any(kw in desc_lower for kw in self.IMPLEMENTATION_KEYWORDS)
-        has_substance = len(description) > 100
+        has_action = signals.impl_hit
+        has_substance = signals.desc_len > 100
 
         if not has_action and not has_substance:
             gaps.append(Gap(
@@ -234,17 +512,13 @@ class FSECReadinessAnalyzer:
 
         return gaps
 
-    def _check_references(self, description: str) -> List[Gap]:
+    def _check_references(self, signals: Signals) -> List[Gap]:
         """Check for links to code, Slack, or related resources."""
         gaps = []
 
-        has_github = 'github.com' in description
-        has_slack = 'slack.com' in description
-        has_jira = bool(re.search(r'\b[A-Z]+-\d+\b', description))
-
         # Not a gap - just a missed opportunity for 'excellent'
         # Only flag if description is very short
-        if not (has_github or has_slack or has_jira) and len(description) < 100:
+        if not signals.refs.any and signals.desc_len < 100:
             gaps.append(Gap(
                 category='context',
                 severity='LOW',
@@ -257,16 +531,13 @@ class FSECReadinessAnalyzer:
 
         return gaps
 
-    def _check_security_context(self, text: str) -> List[Gap]:
+    def _check_security_context(self, signals: Signals) -> List[Gap]:
         """Check for security context when needed."""
         gaps = []
-        text_lower = text.lower()
-
-        has_security_keywords = any(kw in text_lower for kw in self.SECURITY_KEYWORDS)
-        has_security_section = 'security' in text_lower or 'iam policy' in text_lower
 
         # Only flag if security keywords present but no discussion
-        if has_security_keywords and not has_security_section and len(text) < 300:
+        if (signals.security_hit and not signals.security_section_hit
+                and signals.text_len < 300):
             gaps.append(Gap(
                 category='context',
                 severity='MEDIUM',
@@ -279,26 +550,26 @@ class FSECReadinessAnalyzer:
 
         return gaps
 
-    def _identify_strengths(self, description: str, all_text: str, issue: Dict[str, Any]) -> List[str]:
+    def _identify_strengths(self, signals: Signals, issue: Dict[str, Any]) -> List[str]:
         """Identify positive aspects of the ticket."""
         strengths = []
 
         # Problem statement
-        if any(word in description.lower() for word in self.PROBLEM_INDICATORS):
+        if signals.problem_hit:
             strengths.append('Clear problem or request')
 
         # AWS context
-        if any(kw in description.lower() for kw in self.AWS_KEYWORDS):
+        if signals.aws_hit:
             strengths.append('AWS infrastructure context')
 
         # Implementation clarity
-        if any(kw in description.lower() for kw in self.IMPLEMENTATION_KEYWORDS):
+        if signals.impl_hit:
             strengths.append('Clear implementation approach')
 
         # References
-        if 'github.com' in description:
+        if signals.refs.github:
             strengths.append('Code references')
-        if 'slack.com' in description:
+        if signals.refs.slack:
             strengths.append('Slack thread linked')
 
         # Links
@@ -307,87 +578,69 @@ class FSECReadinessAnalyzer:
             strengths.append('Related tickets linked')
 
         # Detailed
-        if len(description) > 200:
+        if signals.desc_len > 200:
             strengths.append('Detailed description')
 
         return strengths
 
-    def _calculate_requirements_score(self, description: str, gaps: List[Gap]) -> float:
+    def _calculate_requirements_score(self, gap_counts: Counter) -> float:
         """Calculate requirements score (0-40) based on FSEC patterns."""
         score = 40.0
 
         # Deduct for gaps
-        req_gaps = [g for g in gaps if g.category == 'requirements']
-        high_severity = sum(1 for g in req_gaps if g.severity == 'HIGH')
-        medium_severity = sum(1 for g in req_gaps if g.severity == 'MEDIUM')
-
-        score -= high_severity * 15  # Reduced from 25
-        score -= medium_severity * 5  # Reduced from 10
+        score -= gap_counts['requirements', 'HIGH'] * 15  # Reduced from 25
+        score -= gap_counts['requirements', 'MEDIUM'] * 5  # Reduced from 10
 
         return max(0, score)
 
-    def _calculate_technical_score(self, description: str, issue: Dict, gaps: List[Gap]) -> float:
+    def _calculate_technical_score(self, gap_counts: Counter, signals: Signals) -> float:
         """Calculate technical score (0-40) with positive scoring for FSEC elements."""
         score = 0
 
         # Award points for what's present
-        desc_lower = description.lower()
 
         # AWS context (15 points)
-        if any(kw in desc_lower for kw in self.AWS_KEYWORDS):
+        if signals.aws_hit:
             score += 15
 
         # Implementation clarity (15 points)
-        if any(kw in desc_lower for kw in self.IMPLEMENTATION_KEYWORDS):
+        if signals.impl_hit:
             score += 15
 
         # References (10 points)
-        has_refs = ('github.com' in description or
-                   'slack.com' in description or
-                   bool(re.search(r'\b[A-Z]+-\d+\b', description)))
-        if has_refs:
+        if signals.refs.any:
             score += 10
 
         # Deduct for gaps
-        tech_gaps = [g for g in gaps if g.category == 'technical']
-        medium_severity = sum(1 for g in tech_gaps if g.severity == 'MEDIUM')
-        score -= medium_severity * 5
+        score -= gap_counts['technical', 'MEDIUM'] * 5
 
         return min(40, max(0, score))
 
-    def _calculate_context_score(self, description: str, gaps: List[Gap]) -> float:
+    def _calculate_context_score(self, gap_counts: Counter) -> float:
         """Calculate context score (0-15)."""
         score = 15.0
 
-        ctx_gaps = [g for g in gaps if g.category == 'context']
-        high_severity = sum(1 for g in ctx_gaps if g.severity == 'HIGH')
-        medium_severity = sum(1 for g in ctx_gaps if g.severity == 'MEDIUM')
-        low_severity = sum(1 for g in ctx_gaps if g.severity == 'LOW')
-
-        score -= high_severity * 10
-        score -= medium_severity * 5
-        score -= low_severity * 2
+        score -= gap_counts['context', 'HIGH'] * 10
+        score -= gap_counts['context', 'MEDIUM'] * 5
+        score -= gap_counts['context', 'LOW'] * 2
 
         return max(0, score)
 
-    def _calculate_testing_score(self, text: str) -> float:
+    def _calculate_testing_score(self, signals: Signals) -> float:
         """Calculate testing score (0-5) - lenient for FSEC."""
-        text_lower = text.lower()
-
         # Award points if ANY testing keywords present
-        has_test_mention = any(kw in text_lower for kw in self.TEST_KEYWORDS)
-
-        # Or if description is substantial (implies thought about verification)
-        if has_test_mention or 'verify' in text_lower:
+        if signals.test_hit:
             return 5.0
 
         # FSEC often handles testing in PR review, so only deduct 2 points
         return 3.0
 
 
-def get_jira_client() -> Jira:
+def get_jira_client() -> 'Jira':
     """Get configured Jira client."""
     import getpass
+    from atlassian import Jira
+    from jira_http import build_session
 
     url = os.getenv('JIRA_URL', 'https://zendesk.atlassian.net')
     default_email = f"{getpass.getuser()}@zendesk.com"
@@ -401,136 +654,138 @@ def get_jira_client() -> Jira:
             f"Then set: export JIRA_API_TOKEN='your_token_here'"
         )
 
-    return Jira(url=url, username=email, password=token, cloud=True)
+    return Jira(url=url, username=email, password=token, cloud=True, session=build_session())
 
 
 def format_report(report: ReadinessReport, verbose: bool = False) -> str:
     """Format readiness report as human-readable text."""
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
     # Header
-    lines.append(f"\n{'='*80}")
-    lines.append(f"FSEC Readiness Analysis: {report.issue_key}")
-    lines.append(f"{'='*80}")
-    lines.append(f"Summary: {report.summary}")
-    lines.append(f"Type: {report.issue_type} | Status: {report.status}")
-    lines.append("")
+    rule = '=' * 80
+    w(f"""
+{rule}
+FSEC Readiness Analysis: {report.issue_key}
+{rule}
+Summary: {report.summary}
+Type: {report.issue_type} | Status: {report.status}
+
+""")
 
     # Score
-    score_emoji = "✅" if report.total_score >= 80 else "⚠️" if report.total_score >= 60 else "❌"
-    lines.append(f"📊 FSEC Readiness Score: {report.total_score:.1f}/100 {score_emoji}")
-    lines.append(f"   Requirements: {report.requirements_score:.1f}/40 (problem, outcome, clarity)")
-    lines.append(f"   Technical:    {report.technical_score:.1f}/40 (AWS context, implementation, refs)")
-    lines.append(f"   Context:      {report.context_score:.1f}/15 (links, security)")
-    lines.append(f"   Testing:      {report.testing_score:.1f}/5  (verification approach)")
-    lines.append("")
-
-    if report.total_score >= 80:
-        lines.append("✅ EXCELLENT - Ready for pointing")
-    elif report.total_score >= 60:
-        lines.append("⚠️  GOOD ENOUGH - Ready for pointing (FSEC threshold)")
-    elif report.total_score >= 45:
-        lines.append("❌ NEEDS WORK - Address gaps before pointing")
-    else:
-        lines.append("❌ NOT READY - Significant gaps to address")
-    lines.append("")
+    score_emoji, verdict = TIER_DISPLAY[report.tier]
+    w(f"""📊 FSEC Readiness Score: {report.total_score:.1f}/100 {score_emoji}
+   Requirements: {report.requirements_score:.1f}/40 (problem, outcome, clarity)
+   Technical:    {report.technical_score:.1f}/40 (AWS context, implementation, refs)
+   Context:      {report.context_score:.1f}/15 (links, security)
+   Testing:      {report.testing_score:.1f}/5  (verification approach)
+
+""")
+
+    w(f"{verdict}\n\n")
 
     # Strengths
     if report.strengths:
-        lines.append(f"✅ Strengths:")
-        for strength in report.strengths:
-            lines.append(f"   • {strength}")
-        lines.append("")
+        w("✅ Strengths:\n")
+        w("".join(f"   • {strength}\n" for strength in report.strengths))
+        w("\n")
 
     # Gaps
     if report.gaps:
-        lines.append(f"❌ Gaps Found ({len(report.gaps)}):")
-        lines.append("")
+        w(f"❌ Gaps Found ({len(report.gaps)}):\n\n")
 
         for i, gap in enumerate(report.gaps, 1):
             severity_emoji = "🔴" if gap.severity == "HIGH" else "🟡" if gap.severity == "MEDIUM" else "🔵"
-            lines.append(f"{i}. {severity_emoji} {gap.title} [{gap.severity}]")
-            lines.append(f"   {gap.description}")
+            w(f"{i}. {severity_emoji} {gap.title} [{gap.severity}]\n")
+            w(f"   {gap.description}\n")
 
             if verbose and gap.actions:
-                lines.append("   Actions:")
-                for a in gap.actions:
-                    lines.append(f"      • {a}")
+                w("   Actions:\n")
+                w("".join(f"      • {a}\n" for a in gap.actions))
 
-            lines.append("")
+            w("\n")
     else:
-        lines.append("✅ No gaps detected!")
-        lines.append("")
+        w("✅ No gaps detected!\n\n")
 
     # Recommendation
-    lines.append("💡 Recommendation:")
+    w("💡 Recommendation:\n")
     if report.ready_for_pointing:
-        lines.append("   This ticket meets FSEC's baseline for pointing.")
-        if report.total_score < 80:
-            lines.append("   Consider addressing gaps for even better clarity.")
+        w("   This ticket meets FSEC's baseline for pointing.\n")
+        if report.tier != 'EXCELLENT':
+            w("   Consider addressing gaps for even better clarity.\n")
     else:
         high_gaps = [g for g in report.gaps if g.severity == 'HIGH']
         if high_gaps:
-            lines.append("   Address these gaps before pointing:")
+            w("   Address these gaps before pointing:\n")
             for gap in high_gaps[:3]:
-                lines.append(f"   • {gap.title}")
+                w(f"   • {gap.title}\n")
                 if gap.actions:
-                    lines.append(f"     → {gap.actions[0]}")
-
-    lines.append("")
-    lines.append(f"Note: Using FSEC-specific scoring (60+ = ready vs. standard 75+)")
-    lines.append(f"{'='*80}\n")
-
-    return "\n".join(lines)
+                    w(f"     → {gap.actions[0]}\n")
+
+    w("\n")
+    w("Note: Using FSEC-specific scoring (60+ = ready vs. standard 75+)\n")
+    w(f"{rule}\n")
+
+    return buf.getvalue()
+
+
+def report_to_dict(report: ReadinessReport) -> Dict[str, Any]:
+    """Convert a readiness report to a JSON-serializable dict."""
+    return {
+        'issue_key': report.issue_key,
+        'summary': report.summary,
+        'issue_type': report.issue_type,
+        'status': report.status,
+        'mode': report.mode,
+        'scores': {
+            'requirements': report.requirements_score,
+            'technical': report.technical_score,
+            'context': report.context_score,
+            'testing': report.testing_score,
+            'total': report.total_score
+        },
+        'tier': report.tier,
+        'ready_for_pointing': report.ready_for_pointing,
+        'gaps': [asdict(g) for g in report.gaps],
+        'strengths': report.strengths
+    }
 
 
 @click.command()
-@click.argument('issue_key')
+@click.argument('issue_key', required=False)
+@click.option('--keys', help='Comma-separated issue keys to analyze in one batch')
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed actions for each gap')
 @click.option('--json-output', '--json', is_flag=True, help='Output as JSON')
-def main(issue_key: str, verbose: bool, json_output: bool):
-    """Analyze a Jira ticket using FSEC-specific readiness criteria."""
+def main(issue_key: str, keys: str, verbose: bool, json_output: bool):
+    """Analyze Jira tickets using FSEC-specific readiness criteria."""
+    issue_keys = [issue_key] if issue_key else []
+    if keys:
+        issue_keys.extend(k.strip() for k in keys.split(',') if k.strip())
+    if not issue_keys:
+        raise click.UsageError('Provide an ISSUE_KEY argument or --keys')
+
     try:
         client = get_jira_client()
         analyzer = FSECReadinessAnalyzer(client)
 
-        click.echo(f"Analyzing {issue_key} (FSEC mode)...", err=True)
-        report = analyzer.analyze(issue_key)
+        click.echo(f"Analyzing {', '.join(issue_keys)} (FSEC mode)...", err=True)
+        reports, missing = analyzer.analyze_many(issue_keys)
 
         if json_output:
-            output = {
-                'issue_key': report.issue_key,
-                'summary': report.summary,
-                'issue_type': report.issue_type,
-                'status': report.status,
-                'mode': report.mode,
-                'scores': {
-                    'requirements': report.requirements_score,
-                    'technical': report.technical_score,
-                    'context': report.context_score,
-                    'testing': report.testing_score,
-                    'total': report.total_score
-                },
-                'ready_for_pointing': report.ready_for_pointing,
-                'gaps': [
-                    {
-                        'category': g.category,
-                        'severity': g.severity,
-                        'title': g.title,
-                        'description': g.description,
-                        'questions': g.questions,
-                        'actions': g.actions
-                    }
-                    for g in report.gaps
-                ],
-                'strengths': report.strengths
-            }
-            click.echo(json.dumps(output, indent=2))
+            # Single ticket keeps the original object output; batches emit a list
+            output = [report_to_dict(r) for r in reports]
+            click.echo(orjson.dumps(output[0] if len(output) == 1 else output,
+                                    option=orjson.OPT_INDENT_2).decode())
         else:
-            click.echo(format_report(report, verbose=verbose))
-
-        # Exit code: 0 if ready, 1 if not ready
-        sys.exit(0 if report.ready_for_pointing else 1)
+            for report in reports:
+                click.echo(format_report(report, verbose=verbose))
+
+        # Exit code: 2 if any ticket was not found, else 0 if all ready, 1 if any not ready
+        if missing:
+            click.echo(f"❌ Error: Issue(s) not found: {', '.join(missing)}", err=True)
+            sys.exit(2)
+        sys.exit(0 if all(r.ready_for_pointing for r in reports) else 1)
 
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
@@ -9,6 +9,7 @@ Usage:
     uv run apply_decisions_csv.py blocked_tickets.csv
     uv run apply_decisions_csv.py blocked_tickets.csv --dry-run
     uv run apply_decisions_csv.py blocked_tickets.csv --yes
+    uv run apply_decisions_csv.py blocked_tickets.csv --yes --workers 10
 
 Supported decisions:
     - CLOSE: Mark ticket as Done with "Won't Do" resolution
@@ -33,10 +34,94 @@ Environment variables:
 import os
 import sys
 import csv
-from typing import List, Dict, Any
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import click
 from atlassian import Jira
+import requests
+
+from jira_http import build_session
+
+
+DEFAULT_WORKERS = 5
+
+DONE_TRANSITION_NAMES = ('done', 'close', 'closed')
+
+VALID_DECISIONS = frozenset(('CLOSE', 'UNBLOCK', 'DOCUMENT', 'KEEP'))
+
+# Buffered worker output is written every PROGRESS_FLUSH_LINES lines or
+# PROGRESS_FLUSH_SECONDS seconds, whichever comes first
+PROGRESS_FLUSH_LINES = 20
+PROGRESS_FLUSH_SECONDS = 1.0
+
+# Enhanced JQL search, used to look up issue types and statuses in batches
+SEARCH_PATH = 'rest/api/2/search/jql'
+BATCH_SIZE = 100
+
+# Jira only lists the transitions available from an issue's current status in
+# its issue type's workflow, so they are cached per (project, issue type ID,
+# status ID). Each issue's type and status come from prefetch_workflow_states.
+_transitions_by_state: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+_transitions_lock = threading.Lock()
+_workflow_states: Dict[str, Tuple[str, str]] = {}
+
+
+class ProgressReporter:
+    """Collect status lines from worker threads and write them in batches.
+
+    Workers only append under a lock; the main thread decides when to write,
+    so output is never interleaved and terminal writes stay batched.
+    """
+
+    def __init__(self, flush_lines: int = PROGRESS_FLUSH_LINES,
+                 flush_seconds: float = PROGRESS_FLUSH_SECONDS):
+        self.flush_lines = flush_lines
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._lines: List[Tuple[str, bool]] = []
+        self._last_flush = time.monotonic()
+
+    def add(self, line: str, err: bool = False) -> None:
+        """Queue a line for stdout, or stderr when ``err`` is set."""
+        with self._lock:
+            self._lines.append((line, err))
+
+    def flush_if_due(self) -> None:
+        """Write queued lines if enough have built up or enough time has passed."""
+        with self._lock:
+            due = (len(self._lines) >= self.flush_lines
+                   or (self._lines and time.monotonic() - self._last_flush >= self.flush_seconds))
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all queued lines, one write per run of same-stream lines."""
+        with self._lock:
+            lines, self._lines = self._lines, []
+            self._last_flush = time.monotonic()
+
+        run: List[str] = []
+        run_err = False
+        for line, err in lines:
+            if run and err != run_err:
+                click.echo('\n'.join(run), err=run_err)
+                run = []
+            run.append(line)
+            run_err = err
+        if run:
+            click.echo('\n'.join(run), err=run_err)
+
+
+_reporter = ProgressReporter()
+
+
+def _echo(message: str, err: bool = False) -> None:
+    """Queue a status line from a worker thread; see ProgressReporter."""
+    _reporter.add(message, err=err)
 
 
 @dataclass
@@ -65,31 +150,45 @@ def get_jira_client() -> Jira:
             f"Then set: export JIRA_API_TOKEN='your_token_here'"
         )
 
-    return Jira(url=url, username=email, password=token, cloud=True)
+    return Jira(url=url, username=email, password=token, cloud=True, session=build_session())
 
 
 def read_decisions_csv(csv_path: str) -> List[DecisionRow]:
     """Read decisions from CSV."""
-    if not os.path.exists(csv_path):
-        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    try:
+        csvfile = open(csv_path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSV file not found: {csv_path}") from None
 
     decisions = []
-    with open(csv_path, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
+    with csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return decisions
+
+        # Only four columns are read, so index rows directly instead of
+        # building a dict per row; missing columns read as blank
+        idx = {name: i for i, name in enumerate(header)}
+        key_i, summary_i, decision_i, notes_i = (
+            idx.get(name, -1) for name in ('Key', 'Summary', 'Decision', 'Notes')
+        )
+
+        def cell(row: List[str], i: int) -> str:
+            return row[i].strip() if 0 <= i < len(row) else ''
 
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (account for header)
-            key = row.get('Key', '').strip()
-            summary = row.get('Summary', '').strip()
-            decision = row.get('Decision', '').strip().upper()
-            notes = row.get('Notes', '').strip()
+            key = cell(row, key_i)
+            summary = cell(row, summary_i)
+            decision = cell(row, decision_i).upper()
+            notes = cell(row, notes_i)
 
             # Skip rows without a key or decision
             if not key or not decision:
                 continue
 
             # Validate decision
-            valid_decisions = ['CLOSE', 'UNBLOCK', 'DOCUMENT', 'KEEP']
-            if decision not in valid_decisions:
+            if decision not in VALID_DECISIONS:
                 click.echo(f"⚠️  Row {row_num}: Unknown decision '{decision}' for {key} - skipping", err=True)
                 continue
 
@@ -137,11 +236,118 @@ def preview_actions(decisions: List[DecisionRow]) -> None:
         click.echo("")
 
 
+def prefetch_workflow_states(client: Jira, keys: List[str]) -> None:
+    """Record each issue's type and status, one JQL search per BATCH_SIZE keys.
+
+    Jira rejects a whole search if any key in it does not exist; the keys of
+    such a batch are left out and fetch their transitions per issue instead.
+    """
+    for start in range(0, len(keys), BATCH_SIZE):
+        params = {
+            'jql': f"key in ({','.join(keys[start:start + BATCH_SIZE])})",
+            'fields': 'issuetype,status',
+            'maxResults': BATCH_SIZE,
+        }
+        try:
+            result = client.get(SEARCH_PATH, params=params) or {}
+        except requests.HTTPError:
+            continue
+        for issue in result.get('issues', []):
+            fields = issue['fields']
+            _workflow_states[issue['key']] = (fields['issuetype']['id'], fields['status']['id'])
+
+
+def _issue_transitions(client: Jira, key: str, refresh: bool = False) -> List[Dict[str, Any]]:
+    """Return the available transitions for ``key``.
+
+    Issues whose type and status were prefetched share one fetch per
+    (project, type, status); others, or ``refresh``, ask Jira for this issue.
+    """
+    state = _workflow_states.get(key)
+    if state is None or refresh:
+        return client.get_issue_transitions(key)
+
+    cache_key = (key.split('-')[0], *state)
+    with _transitions_lock:
+        transitions = _transitions_by_state.get(cache_key)
+        if transitions is None:
+            transitions = client.get_issue_transitions(key)
+            _transitions_by_state[cache_key] = transitions
+    return transitions
+
+
+def _find_transition_to(client: Jira, key: str, status: str, refresh: bool = False) -> Optional[int]:
+    """Return the ID of the transition that moves ``key`` to ``status``, if any.
+
+    Matches on the target status name, as Jira.set_issue_status does, but
+    against the shared cache instead of fetching transitions per ticket.
+    """
+    for t in _issue_transitions(client, key, refresh):
+        if t['to'].lower() == status.lower():
+            return int(t['id'])
+    return None
+
+
+def _find_done_transition(client: Jira, key: str, refresh: bool = False) -> Optional[int]:
+    """Return the ID of the transition that closes ``key``, if any.
+
+    Prefers a transition into the Done status, falling back to transitions
+    named like DONE_TRANSITION_NAMES for workflows that close elsewhere.
+    """
+    transition_id = _find_transition_to(client, key, 'Done', refresh)
+    if transition_id is not None:
+        return transition_id
+
+    by_name = {t['name'].lower(): int(t['id']) for t in _issue_transitions(client, key, refresh)}
+    for name in DONE_TRANSITION_NAMES:
+        if name in by_name:
+            return by_name[name]
+    return None
+
+
+def _transition_issue(client: Jira, key: str, transition_id: int, comment: str,
+                      fields: Optional[Dict[str, Any]] = None) -> None:
+    """Execute a transition by ID and add ``comment`` in the same request."""
+    data: Dict[str, Any] = {
+        'transition': {'id': transition_id},
+        'update': {'comment': [{'add': {'body': comment}}]},
+    }
+    if fields is not None:
+        data['fields'] = fields
+    client.post(f"{client.resource_url('issue')}/{key}/transitions", data=data)
+
+
+def _apply_transition(client: Jira, key: str,
+                      find: Callable[..., Optional[int]],
+                      comment: str, fields: Optional[Dict[str, Any]] = None) -> bool:
+    """Transition ``key`` using the ID ``find`` picks, with ``comment``.
+
+    The cached transitions can be stale if the issue changed since the
+    prefetch, so when they have no match or Jira rejects the ID with a 400,
+    the issue's own transitions are fetched and tried once more. Returns
+    False if no matching transition exists.
+    """
+    transition_id = find(client, key, refresh=False)
+    if transition_id is not None:
+        try:
+            _transition_issue(client, key, transition_id, comment, fields)
+            return True
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 400:
+                raise
+
+    transition_id = find(client, key, refresh=True)
+    if transition_id is None:
+        return False
+    _transition_issue(client, key, transition_id, comment, fields)
+    return True
+
+
 def apply_decision_close(client: Jira, key: str, notes: str, dry_run: bool) -> bool:
     """Close a ticket with Won't Do resolution."""
     try:
         if dry_run:
-            click.echo(f"[DRY RUN] Would close {key} with resolution 'Won't Do'")
+            _echo(f"[DRY RUN] Would close {key} with resolution 'Won't Do'")
             return True
 
         # Add comment explaining closure
@@ -152,29 +358,19 @@ def apply_decision_close(client: Jira, key: str, notes: str, dry_run: bool) -> b
         if notes:
             comment += f"Notes: {notes}\n"
 
-        client.issue_add_comment(key, comment)
-
-        # Transition to Done with Won't Do resolution
-        # Note: Transition IDs may vary by Jira instance
-        # This attempts to find and use the "Done" transition
-        transitions = client.get_issue_transitions(key)
-        done_transition = None
+        # Transition to Done with Won't Do resolution, carrying the comment in
+        # the same request. Transition IDs come from the shared cache.
+        closed = _apply_transition(client, key, _find_done_transition, comment,
+                                   fields={'resolution': {'name': 'Won\'t Do'}})
 
-        for t in transitions['transitions']:
-            if t['name'].lower() in ['done', 'close', 'closed']:
-                done_transition = t['id']
-                break
-
-        if done_transition:
-            client.set_issue_status(key, 'Done', fields={'resolution': {'name': 'Won\'t Do'}})
-            click.echo(f"✅ Closed {key}")
-        else:
-            click.echo(f"⚠️  {key}: Could not find 'Done' transition - added comment only", err=True)
+        if not closed:
+            client.issue_add_comment(key, comment)
+            _echo(f"⚠️  {key}: Could not find 'Done' transition - added comment only", err=True)
 
         return True
 
     except Exception as e:
-        click.echo(f"❌ {key}: Failed to close - {e}", err=True)
+        _echo(f"❌ {key}: Failed to close - {e}", err=True)
         return False
 
 
@@ -182,7 +378,7 @@ def apply_decision_unblock(client: Jira, key: str, notes: str, dry_run: bool) ->
     """Unblock a ticket by changing status to To Do."""
     try:
         if dry_run:
-            click.echo(f"[DRY RUN] Would unblock {key} (change to To Do)")
+            _echo(f"[DRY RUN] Would unblock {key} (change to To Do)")
             return True
 
         # Add comment explaining unblock
@@ -194,15 +390,16 @@ def apply_decision_unblock(client: Jira, key: str, notes: str, dry_run: bool) ->
         else:
             comment += "Blocker appears to be resolved. Moving to To Do.\n"
 
-        client.issue_add_comment(key, comment)
+        # Transition to To Do, carrying the comment in the same request
+        find_todo = functools.partial(_find_transition_to, status='To Do')
+        if not _apply_transition(client, key, find_todo, comment):
+            _echo(f"❌ {key}: Could not find a transition to 'To Do'", err=True)
+            return False
 
-        # Transition to To Do
-        client.set_issue_status(key, 'To Do')
-        click.echo(f"✅ Unblocked {key}")
         return True
 
     except Exception as e:
-        click.echo(f"❌ {key}: Failed to unblock - {e}", err=True)
+        _echo(f"❌ {key}: Failed to unblock - {e}", err=True)
         return False
 
 
@@ -210,7 +407,7 @@ def apply_decision_document(client: Jira, key: str, notes: str, dry_run: bool) -
     """Request blocker documentation via comment."""
     try:
         if dry_run:
-            click.echo(f"[DRY RUN] Would add documentation request comment to {key}")
+            _echo(f"[DRY RUN] Would add documentation request comment to {key}")
             return True
 
         # Add comment requesting blocker documentation
@@ -231,40 +428,61 @@ def apply_decision_document(client: Jira, key: str, notes: str, dry_run: bool) -
         )
 
         client.issue_add_comment(key, comment)
-        click.echo(f"✅ Added documentation request to {key}")
         return True
 
     except Exception as e:
-        click.echo(f"❌ {key}: Failed to add comment - {e}", err=True)
+        _echo(f"❌ {key}: Failed to add comment - {e}", err=True)
         return False
 
 
-def apply_decisions(client: Jira, decisions: List[DecisionRow], dry_run: bool = False) -> Dict[str, int]:
-    """Apply all decisions."""
-    stats = {'success': 0, 'failed': 0, 'skipped': 0}
+def _dispatch(client: Jira, decision_row: DecisionRow, dry_run: bool) -> Optional[bool]:
+    """Apply a single decision, returning None if the decision is unknown."""
+    key = decision_row.key
+    decision = decision_row.decision
+    notes = decision_row.notes
 
-    for decision_row in decisions:
-        key = decision_row.key
-        decision = decision_row.decision
-        notes = decision_row.notes
-
-        success = False
-        if decision == 'CLOSE':
-            success = apply_decision_close(client, key, notes, dry_run)
-        elif decision == 'UNBLOCK':
-            success = apply_decision_unblock(client, key, notes, dry_run)
-        elif decision == 'DOCUMENT':
-            success = apply_decision_document(client, key, notes, dry_run)
-        else:
-            click.echo(f"⚠️  {key}: Unknown decision '{decision}' - skipping", err=True)
-            stats['skipped'] += 1
-            continue
+    if decision == 'CLOSE':
+        return apply_decision_close(client, key, notes, dry_run)
+    if decision == 'UNBLOCK':
+        return apply_decision_unblock(client, key, notes, dry_run)
+    if decision == 'DOCUMENT':
+        return apply_decision_document(client, key, notes, dry_run)
 
-        if success:
-            stats['success'] += 1
-        else:
-            stats['failed'] += 1
+    _echo(f"⚠️  {key}: Unknown decision '{decision}' - skipping", err=True)
+    return None
 
+
+def apply_decisions(client: Jira, decisions: List[DecisionRow], dry_run: bool = False,
+                    workers: int = DEFAULT_WORKERS) -> Dict[str, int]:
+    """Apply all decisions concurrently, bounded by ``workers`` threads.
+
+    Successful updates advance a progress bar rather than printing a line
+    each; warnings, failures and dry-run lines are written in batches.
+    """
+    stats = {'success': 0, 'failed': 0, 'skipped': 0}
+
+    if not dry_run:
+        prefetch_workflow_states(client, [d.key for d in decisions if d.decision in ('CLOSE', 'UNBLOCK')])
+
+    with ThreadPoolExecutor(max_workers=workers) as executor, \
+            click.progressbar(length=len(decisions), label='Updating tickets',
+                              hidden=dry_run, file=sys.stderr) as progress:
+        futures = [
+            executor.submit(_dispatch, client, decision_row, dry_run)
+            for decision_row in decisions
+        ]
+        for future in as_completed(futures):
+            success = future.result()
+            if success is None:
+                stats['skipped'] += 1
+            elif success:
+                stats['success'] += 1
+            else:
+                stats['failed'] += 1
+            progress.update(1)
+            _reporter.flush_if_due()
+
+    _reporter.flush()
     return stats
 
 
@@ -274,7 +492,9 @@ def apply_decisions(client: Jira, decisions: List[DecisionRow], dry_run: bool =
               help='Preview actions without making changes')
 @click.option('--yes', '-y', is_flag=True,
               help='Skip confirmation prompt')
-def main(csv_file: str, dry_run: bool, yes: bool):
+@click.option('--workers', '-w', type=click.IntRange(min=1), default=DEFAULT_WORKERS,
+              show_default=True, help='Number of tickets to update concurrently')
+def main(csv_file: str, dry_run: bool, yes: bool, workers: int):
     """
     Apply decisions from CSV to blocked tickets.
 
@@ -289,6 +509,9 @@ def main(csv_file: str, dry_run: bool, yes: bool):
 
         # Apply without confirmation
         uv run apply_decisions_csv.py blocked.csv --yes
+
+        # Limit concurrent Jira updates
+        uv run apply_decisions_csv.py blocked.csv --yes --workers 2
     """
     try:
         # Read decisions
@@ -319,7 +542,7 @@ def main(csv_file: str, dry_run: bool, yes: bool):
             click.echo("Applying decisions...")
         click.echo(f"{'='*80}\n")
 
-        stats = apply_decisions(client, decisions, dry_run=dry_run)
+        stats = apply_decisions(client, decisions, dry_run=dry_run, workers=workers)
 
         # Summary
         click.echo(f"\n{'='*80}")
@@ -8,6 +8,7 @@ Add your decisions in the 'Decision' column, then reimport with apply_decisions_
 Usage:
     uv run export_blocked_csv.py --output blocked_tickets.csv
     uv run export_blocked_csv.py --min-age-days 30 --output old_blocked.csv
+    uv run export_blocked_csv.py --extract-reasons --output blocked_tickets.csv
 
 Decision options:
     - CLOSE: Mark ticket as Done with "Won't Do" resolution
@@ -33,11 +34,62 @@ import os
 import sys
 import csv
 import re
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+from datetime import date
 import click
 from atlassian import Jira
 
+from jira_http import build_session
+
+
+# Enhanced JQL search on the v2 API: plain-text descriptions and comments, and
+# token-based pagination (Cloud no longer accepts startAt offsets)
+SEARCH_PATH = 'rest/api/2/search/jql'
+
+# Key-only listing pages can be large; field-bearing batches are capped at 100
+KEY_PAGE_SIZE = 5000
+BATCH_SIZE = 100
+
+# Concurrent batch fetches; keep modest to stay under Jira rate limits
+MAX_WORKERS = 4
+
+# Fields needed for every row; description and comments are the largest parts
+# of an issue payload and are only fetched when blocker reasons are extracted
+LISTING_FIELDS = ['summary', 'priority', 'created', 'issuelinks']
+REASON_FIELDS = ['description', 'comment']
+
+# Returned by extract_blocker_reason when nothing explains the block
+NO_BLOCKER = "No documented blocker"
+
+# Linked-blocker statuses that mean the blocker has been cleared
+RESOLVED_STATUSES = frozenset(('Resolved', 'Done', 'Closed'))
+
+# Ages are measured against a single "today" for the whole export
+TODAY = date.today()
+
+# Phrases that introduce a blocker explanation, fused into one alternation so
+# the text is scanned once. Each branch captures its reason in a named group,
+# which match.lastgroup identifies; reasons are ranked in branch order. The
+# alternation sits in a lookahead so one branch's match cannot hide another
+# branch's overlapping match, keeping the results of three separate scans; the
+# leading first-letter class lets most positions fail without trying a branch.
+BLOCKER_RE = re.compile(
+    r'(?=[bcdnw])'
+    r'(?=(?:blocked by|waiting (?:on|for)|depends on|needs)\s+(?P<dependency>[^\n.]+)'
+    r'|(?:blocker|blocking issue):\s*(?P<label>[^\n.]+)'
+    r'|(?:cannot proceed|can\'t start) (?:until|because)\s+(?P<condition>[^\n.]+))',
+    re.IGNORECASE,
+)
+
+# Matches kept per branch of BLOCKER_RE, and distinct reasons reported
+MAX_MATCHES_PER_PATTERN = 2
+MAX_REASONS = 2
+
+# Shorter captures are fragments rather than explanations
+MIN_REASON_LENGTH = 11
+
 
 def get_jira_client() -> Jira:
     """Get configured Jira client."""
@@ -55,16 +107,21 @@ def get_jira_client() -> Jira:
             f"Then set: export JIRA_API_TOKEN='your_token_here'"
         )
 
-    return Jira(url=url, username=email, password=token, cloud=True)
+    return Jira(url=url, username=email, password=token, cloud=True, session=build_session())
 
 
 def calculate_days_since(date_str: str) -> int:
-    """Calculate days since a date string."""
+    """Calculate days since a date string (0 if it is missing or malformed)."""
+    if not date_str or len(date_str) < 10:
+        return 0
+
+    # Jira timestamps start with YYYY-MM-DD; slicing skips strptime's
+    # format parsing
     try:
-        date = datetime.strptime(date_str[:10], '%Y-%m-%d')
-        return (datetime.now() - date).days
-    except:
+        day = date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+    except ValueError:
         return 0
+    return (TODAY - day).days
 
 
 def format_age(days: int) -> str:
@@ -86,36 +143,65 @@ def format_age(days: int) -> str:
         return f"{years}y"
 
 
+def _select_reasons(by_pattern: Dict[str, List[str]]) -> Tuple[List[str], bool]:
+    """Pick the first distinct, substantive reasons in pattern order.
+
+    Also reports whether the selection is final: later matches can only
+    change it while a higher-ranked pattern still has room for matches.
+    """
+    reasons: List[str] = []
+    seen = set()
+    has_room = False
+    for matches in by_pattern.values():
+        for reason in matches:
+            folded = reason.lower()
+            if folded not in seen and len(reason) >= MIN_REASON_LENGTH:
+                reasons.append(reason)
+                seen.add(folded)
+                if len(reasons) == MAX_REASONS:
+                    return reasons, not has_room
+        has_room = has_room or len(matches) < MAX_MATCHES_PER_PATTERN
+    return reasons, not has_room
+
+
 def extract_blocker_reason(description: str, comments: List[str]) -> str:
     """Extract why the ticket is blocked from description or comments."""
-    all_text = f"{description}\n" + "\n".join(comments)
-
-    blocker_patterns = [
-        r'(?:blocked by|waiting (?:on|for)|depends on|needs)\s+([^\n.]+)',
-        r'(?:blocker|blocking issue):\s*([^\n.]+)',
-        r'(?:cannot proceed|can\'t start) (?:until|because)\s+([^\n.]+)',
-    ]
-
-    reasons = []
-    for pattern in blocker_patterns:
-        matches = re.findall(pattern, all_text, re.IGNORECASE)
-        reasons.extend(matches[:2])
-
-    if reasons:
-        cleaned = []
-        seen = set()
-        for reason in reasons:
-            reason = reason.strip()
-            if reason.lower() not in seen and len(reason) > 10:
-                cleaned.append(reason)
-                seen.add(reason.lower())
-        return '; '.join(cleaned[:2])  # Max 2 reasons
-
-    return "No documented blocker"
-
-
-def find_linked_blockers(issue: Dict[str, Any]) -> str:
-    """Find tickets that are blocking this issue."""
+    by_pattern: Dict[str, List[str]] = {name: [] for name in BLOCKER_RE.groupindex}
+    settled = False
+
+    # Reasons stop at line breaks, so the description and each comment are
+    # scanned on their own instead of joining them into one large string.
+    # Scanning stops as soon as further matches cannot change the result.
+    for chunk in chain([description], comments):
+        resume_at = dict.fromkeys(BLOCKER_RE.groupindex, 0)
+        for match in BLOCKER_RE.finditer(chunk):
+            group = match.lastgroup
+            # Matches of the same branch do not overlap, as with findall
+            if match.start() < resume_at[group]:
+                continue
+            resume_at[group] = match.end(group)
+            matches = by_pattern[group]
+            if len(matches) < MAX_MATCHES_PER_PATTERN:
+                matches.append(match.group(group).strip())
+                if len(matches) == MAX_MATCHES_PER_PATTERN:
+                    settled = _select_reasons(by_pattern)[1]
+                    if settled:
+                        break
+        if settled:
+            break
+
+    if not any(by_pattern.values()):
+        return NO_BLOCKER
+
+    reasons, _ = _select_reasons(by_pattern)
+    return '; '.join(reasons)
+
+
+def find_linked_blockers(issue: Dict[str, Any]) -> Tuple[str, List[Tuple[str, str]]]:
+    """Find tickets that are blocking this issue.
+
+    Returns the display string for the CSV and the ``(key, status)`` pairs.
+    """
     blockers = []
     links = issue.get('fields', {}).get('issuelinks', [])
 
@@ -125,101 +211,157 @@ def find_linked_blockers(issue: Dict[str, Any]) -> str:
             blocker_key = link['inwardIssue'].get('key')
             blocker_status = link['inwardIssue'].get('fields', {}).get('status', {}).get('name', 'Unknown')
             if blocker_key:
-                blockers.append(f"{blocker_key} ({blocker_status})")
+                blockers.append((blocker_key, blocker_status))
+
+    display = '; '.join(f"{key} ({status})" for key, status in blockers) if blockers else "None"
+    return display, blockers
 
-    return '; '.join(blockers) if blockers else "None"
 
+def suggest_decision(age_days: int, blockers: List[Tuple[str, str]],
+                     blocker_reason: Optional[str]) -> str:
+    """Suggest a decision based on ticket metadata.
 
-def suggest_decision(age_days: int, linked_blockers: str, blocker_reason: str) -> str:
-    """Suggest a decision based on ticket metadata."""
+    ``blocker_reason`` is None when reasons were not extracted; a ticket with
+    no linked blockers then has nothing on record explaining the block.
+    """
     # Ancient tickets likely should be closed
     if age_days > 180:
         return "CLOSE"
 
     # Resolved blockers suggest unblocking
-    if 'Resolved' in linked_blockers or 'Done' in linked_blockers or 'Closed' in linked_blockers:
+    if any(status in RESOLVED_STATUSES for _, status in blockers):
         return "UNBLOCK"
 
     # No documented reason needs documentation
-    if "no documented" in blocker_reason.lower():
+    if blocker_reason == NO_BLOCKER or (blocker_reason is None and not blockers):
         return "DOCUMENT"
 
     # Recent tickets with clear blockers should be kept
-    if age_days < 90 and linked_blockers != "None":
+    if age_days < 90 and blockers:
         return "KEEP"
 
     return ""  # No suggestion
 
 
+def search_issue_keys(client: Jira, jql: str) -> List[str]:
+    """List every issue key matching ``jql``, following page tokens."""
+    keys: List[str] = []
+    params: Dict[str, Any] = {'jql': jql, 'fields': 'id', 'maxResults': KEY_PAGE_SIZE}
+
+    while True:
+        result = client.get(SEARCH_PATH, params=params) or {}
+        keys.extend(issue['key'] for issue in result.get('issues', []))
+        token = result.get('nextPageToken')
+        if result.get('isLast', True) or not token:
+            return keys
+        params['nextPageToken'] = token
+
+
+def _fetch_batch(client: Jira, keys: List[str], fields: List[str]) -> List[Dict[str, Any]]:
+    """Fetch one batch of issues with a single JQL search."""
+    params = {
+        'jql': f"key in ({','.join(keys)})",
+        'fields': ','.join(fields),
+        'maxResults': BATCH_SIZE,
+    }
+    result = client.get(SEARCH_PATH, params=params) or {}
+    return result.get('issues', [])
+
+
+def iter_issues(client: Jira, keys: List[str], fields: List[str]) -> Iterator[Dict[str, Any]]:
+    """Yield the issues for ``keys`` in the given order.
+
+    Batches of BATCH_SIZE keys are fetched on a small thread pool and yielded
+    as each batch completes, so callers can process them incrementally.
+    """
+    batches = [keys[start:start + BATCH_SIZE] for start in range(0, len(keys), BATCH_SIZE)]
+    if not batches:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(batches))) as executor:
+        results = executor.map(lambda batch: _fetch_batch(client, batch, fields), batches)
+        for batch, batch_issues in zip(batches, results):
+            by_key = {issue['key']: issue for issue in batch_issues}
+            for key in batch:
+                issue = by_key.pop(key, None)
+                if issue is not None:
+                    yield issue
+
+
 def export_blocked_to_csv(
     client: Jira,
     project: str,
     min_age_days: int,
-    output_path: str
+    output_path: str,
+    extract_reasons: bool = False
 ):
-    """Export blocked tickets to CSV."""
+    """Export blocked tickets to CSV.
+
+    Blocker reasons are only extracted from descriptions and comments when
+    ``extract_reasons`` is set; otherwise that column is left blank.
+    """
     # Find blocked tickets
     jql = f'project = {project} AND status = Blocked'
     if min_age_days > 0:
         jql += f' AND created <= -{min_age_days}d'
     jql += ' ORDER BY created ASC'  # Oldest first
 
-    fields = ['summary', 'status', 'priority', 'created', 'updated',
-              'description', 'comment', 'issuelinks']
+    fields = LISTING_FIELDS + REASON_FIELDS if extract_reasons else LISTING_FIELDS
 
-    result = client.jql(jql, limit=100, fields=fields)
-    issues = result.get('issues', [])
+    keys = search_issue_keys(client, jql)
 
-    if not issues:
+    if not keys:
         click.echo("No blocked tickets found.", err=True)
         return
 
-    # Prepare CSV data
-    rows = []
-    for issue in issues:
-        key = issue['key']
-        fields = issue['fields']
-
-        summary = fields.get('summary', 'No summary')
-        priority = fields.get('priority', {}).get('name', 'None')
-        created = fields.get('created', '')
-        age_days = calculate_days_since(created)
-        age_str = format_age(age_days)
-
-        description = fields.get('description', '') or ''
-        comment_data = fields.get('comment', {}).get('comments', [])
-        comments = [c.get('body', '') for c in comment_data]
-
-        blocker_reason = extract_blocker_reason(description, comments)
-        linked_blockers = find_linked_blockers(issue)
-
-        suggested_decision = suggest_decision(age_days, linked_blockers, blocker_reason)
-
-        rows.append({
-            'Key': key,
-            'Summary': summary,
-            'Priority': priority,
-            'Age (days)': age_days,
-            'Age': age_str,
-            'Blocker Reason': blocker_reason,
-            'Linked Blockers': linked_blockers,
-            'Decision': suggested_decision,
-            'Notes': ''
-        })
-
-    # Write CSV
     fieldnames = ['Key', 'Summary', 'Priority', 'Age (days)', 'Age',
                   'Blocker Reason', 'Linked Blockers', 'Decision', 'Notes']
 
+    # Write each row as its issue arrives rather than buffering the export
+    exported = 0
     with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(rows)
 
-    click.echo(f"✅ Exported {len(rows)} blocked tickets to: {output_path}")
+        for issue in iter_issues(client, keys, fields):
+            key = issue['key']
+            issue_fields = issue['fields']
+
+            summary = issue_fields.get('summary', 'No summary')
+            priority = issue_fields.get('priority', {}).get('name', 'None')
+            created = issue_fields.get('created', '')
+            age_days = calculate_days_since(created)
+            age_str = format_age(age_days)
+
+            blocker_reason = None
+            if extract_reasons:
+                description = issue_fields.get('description', '') or ''
+                comment_data = issue_fields.get('comment', {}).get('comments', [])
+                comments = [c.get('body', '') for c in comment_data]
+                blocker_reason = extract_blocker_reason(description, comments)
+            linked_blockers, blockers = find_linked_blockers(issue)
+
+            suggested_decision = suggest_decision(age_days, blockers, blocker_reason)
+
+            writer.writerow({
+                'Key': key,
+                'Summary': summary,
+                'Priority': priority,
+                'Age (days)': age_days,
+                'Age': age_str,
+                'Blocker Reason': blocker_reason or '',
+                'Linked Blockers': linked_blockers,
+                'Decision': suggested_decision,
+                'Notes': ''
+            })
+            exported += 1
+
+    click.echo(f"✅ Exported {exported} blocked tickets to: {output_path}")
     click.echo(f"\nNext steps:")
     click.echo(f"1. Open the CSV in your spreadsheet app")
     click.echo(f"2. Review the 'Decision' column (suggested values provided)")
+    if not extract_reasons:
+        click.echo(f"   'Blocker Reason' is blank; re-export with --extract-reasons to fill it in")
     click.echo(f"3. Update decisions as needed:")
     click.echo(f"   - CLOSE: Mark as Done (Won't Do)")
     click.echo(f"   - UNBLOCK: Change to To Do status")
@@ -235,7 +377,9 @@ def export_blocked_to_csv(
               help='Only export tickets blocked for at least N days')
 @click.option('--output', '-o', type=click.Path(), required=True,
               help='Output CSV file path')
-def main(project: str, min_age_days: int, output: str):
+@click.option('--extract-reasons', is_flag=True,
+              help='Fetch descriptions and comments to fill in the Blocker Reason column')
+def main(project: str, min_age_days: int, output: str, extract_reasons: bool):
     """
     Export blocked tickets to CSV for decision-making.
 
@@ -245,6 +389,9 @@ def main(project: str, min_age_days: int, output: str):
 
         # Only ancient tickets (>6 months)
         uv run export_blocked_csv.py --min-age-days 180 --output ancient_blocked.csv
+
+        # Include blocker reasons (slower: fetches descriptions and comments)
+        uv run export_blocked_csv.py --extract-reasons --output blocked.csv
     """
     try:
         client = get_jira_client()
@@ -253,7 +400,7 @@ def main(project: str, min_age_days: int, output: str):
         if min_age_days > 0:
             click.echo(f"Filtering to tickets blocked ≥ {min_age_days} days...", err=True)
 
-        export_blocked_to_csv(client, project, min_age_days, output)
+        export_blocked_to_csv(client, project, min_age_days, output, extract_reasons)
 
         sys.exit(0)
 
@@ -37,22 +37,75 @@ Environment variables:
 
 import os
 import sys
-from typing import List, Dict, Any
-from datetime import datetime
+import contextlib
+import json
+import time
+import getpass
+import hashlib
+import tempfile
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Dict, Any, Optional, Sequence, Tuple
+from bisect import bisect_right
+from datetime import date
 import click
 from atlassian import Jira
 
+from jira_http import build_session
 
-def get_jira_client() -> Jira:
-    """Get configured Jira client."""
-    import getpass
 
+# Enhanced JQL search; Cloud pages it with nextPageToken rather than startAt
+SEARCH_PATH = 'rest/api/2/search/jql'
+
+# Enhanced search has no 'total'; this returns the match count in one request
+COUNT_PATH = 'rest/api/3/search/approximate-count'
+
+# Key-only listing pages can be large; field-bearing batches are capped at 100
+KEY_PAGE_SIZE = 5000
+BATCH_SIZE = 100
+
+# Concurrent batch fetches; keep modest to stay under Jira rate limits
+MAX_WORKERS = 5
+
+# Fields rendered by iter_ticket_lines; anything else is wasted payload
+DEFAULT_FIELDS = ['summary', 'status', 'priority', 'created']
+
+# Search results are cached briefly so repeated runs skip Jira
+CACHE_DIR = Path.home() / '.cache' / 'jira-grooming'
+CACHE_TTL = 120  # seconds
+
+# FSEC grooming board filter, minus the project clause
+FSEC_GROOMING_WHERE = (
+    'type in (Spike, Story, Task) AND '
+    'status in (Backlog, "In Progress", Blocked, Intake, '
+    '"Ready to Refine", "Ready to Ship", Refined, "To Do", '
+    'Shipping, Testing, Review)'
+)
+FSEC_GROOMING_ORDER_BY = 'ORDER BY updated DESC'
+
+
+@dataclass
+class CacheEntry:
+    """Cached search results with the full match count and timestamp."""
+    issues: List[Dict[str, Any]]
+    total: int
+    timestamp: float
+
+
+def jira_identity() -> Tuple[str, str]:
+    """Return the (Jira URL, user email) this run talks to."""
     url = os.getenv('JIRA_URL', 'https://zendesk.atlassian.net')
 
     # Default email to {username}@zendesk.com
     default_email = f"{getpass.getuser()}@zendesk.com"
-    email = os.getenv('JIRA_EMAIL', default_email)
+    return url, os.getenv('JIRA_EMAIL', default_email)
 
+
+def get_jira_client() -> Jira:
+    """Get configured Jira client."""
+    url, email = jira_identity()
     token = os.getenv('JIRA_API_TOKEN', '')
 
     if not token:
@@ -62,12 +115,68 @@ def get_jira_client() -> Jira:
             f"Then set: export JIRA_API_TOKEN='your_token_here'"
         )
 
-    return Jira(url=url, username=email, password=token, cloud=True)
+    return Jira(url=url, username=email, password=token, cloud=True, session=build_session())
 
 
-def get_fsec_grooming_filter(project: str = 'FSEC') -> str:
+def _cache_file(jql: str, limit: int, fields: List[str]) -> Path:
+    # Results depend on which instance and account ran the query, not just the JQL
+    url, email = jira_identity()
+    key = hashlib.sha1(f"{url}|{email}|{jql}|{limit}|{','.join(fields)}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def load_cache(jql: str, limit: int, fields: List[str]) -> Optional[CacheEntry]:
+    """Load cached search results if still fresh.
+
+    The cache is only an optimization: unreadable or malformed entries are
+    treated as a miss, with a warning for I/O errors.
+    """
+    cache_file = _cache_file(jql, limit, fields)
+    try:
+        data = json.loads(cache_file.read_text())
+        entry = CacheEntry(issues=data['issues'], total=data['total'], timestamp=data['timestamp'])
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        click.echo(f"⚠️  Search cache read failed: {e}", err=True)
+        return None
+    except (ValueError, KeyError, TypeError):
+        return None
+
+    if time.time() - entry.timestamp > CACHE_TTL:
+        return None
+    return entry
+
+
+def save_cache(jql: str, limit: int, fields: List[str], issues: List[Dict[str, Any]], total: int) -> None:
+    """Save search results to the cache, warning instead of failing on I/O errors.
+
+    Writes go to a temp file that is renamed over the entry, so an interrupted
+    write never leaves a truncated cache file behind.
+    """
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file = _cache_file(jql, limit, fields)
+        with tempfile.NamedTemporaryFile('w', dir=CACHE_DIR, prefix=f"{cache_file.stem}.",
+                                         suffix='.tmp', delete=False) as tmp:
+            tmp_name = tmp.name
+            json.dump({
+                'issues': issues,
+                'total': total,
+                'timestamp': time.time(),
+            }, tmp)
+        os.replace(tmp_name, cache_file)
+    except (OSError, ValueError) as e:
+        click.echo(f"⚠️  Search cache write failed: {e}", err=True)
+        if tmp_name:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+
+def get_fsec_grooming_filter(project: str = 'FSEC', extra_conditions: Sequence[str] = ()) -> str:
     """
-    Get the standard FSEC grooming filter.
+    Get the standard FSEC grooming filter, ANDed with any ``extra_conditions``.
 
     This matches the team's actual grooming board filter:
     https://zendesk.atlassian.net/jira/software/c/projects/FSEC/list?filter=...
@@ -76,14 +185,8 @@ def get_fsec_grooming_filter(project: str = 'FSEC') -> str:
     Statuses: All active workflow states except Done
     Sorted by: Most recently updated first
     """
-    return (
-        f'project = {project} AND '
-        f'type in (Spike, Story, Task) AND '
-        f'status in (Backlog, "In Progress", Blocked, Intake, '
-        f'"Ready to Refine", "Ready to Ship", Refined, "To Do", '
-        f'Shipping, Testing, Review) '
-        f'ORDER BY updated DESC'
-    )
+    where = ' AND '.join([f'project = {project}', FSEC_GROOMING_WHERE, *extra_conditions])
+    return f'{where} {FSEC_GROOMING_ORDER_BY}'
 
 
 def build_jql(
@@ -97,8 +200,6 @@ def build_jql(
     """Build JQL query based on search criteria."""
     # If using preset grooming filter, return it directly
     if use_grooming_filter:
-        base_jql = get_fsec_grooming_filter(project or 'FSEC')
-
         # Add additional filters if specified
         extra_conditions = []
         if label:
@@ -106,12 +207,7 @@ def build_jql(
         if unestimated:
             extra_conditions.append('("Story Points" IS EMPTY OR "Story Points" = 0)')
 
-        if extra_conditions:
-            # Insert extra conditions before ORDER BY
-            parts = base_jql.split(' ORDER BY ')
-            base_jql = parts[0] + ' AND ' + ' AND '.join(extra_conditions) + ' ORDER BY ' + parts[1]
-
-        return base_jql
+        return get_fsec_grooming_filter(project or 'FSEC', extra_conditions)
 
     # Custom filter building
     conditions = []
@@ -144,74 +240,160 @@ def build_jql(
     return jql
 
 
-def format_age(created_str: str) -> str:
-    """Format ticket age in human-readable form."""
+def _plural(count: int, unit: str) -> str:
+    return f"{count} {unit}{'s' if count > 1 else ''}"
+
+
+# Exclusive upper bounds (in days) of each age bucket, and how to render it
+AGE_BOUNDS = [1, 2, 7, 30, 365]
+AGE_LABELS = [
+    lambda days: "Today",
+    lambda days: "1 day",
+    lambda days: f"{days} days",
+    lambda days: _plural(days // 7, 'week'),
+    lambda days: _plural(days // 30, 'month'),
+    lambda days: _plural(days // 365, 'year'),
+]
+
+
+def format_age(created_str: Optional[str], today: date) -> str:
+    """Format ticket age relative to ``today`` in human-readable form."""
+    if not created_str:
+        return "Unknown"
     try:
-        created = datetime.strptime(created_str[:10], '%Y-%m-%d')
-        age_days = (datetime.now() - created).days
-
-        if age_days == 0:
-            return "Today"
-        elif age_days == 1:
-            return "1 day"
-        elif age_days < 7:
-            return f"{age_days} days"
-        elif age_days < 30:
-            weeks = age_days // 7
-            return f"{weeks} week{'s' if weeks > 1 else ''}"
-        elif age_days < 365:
-            months = age_days // 30
-            return f"{months} month{'s' if months > 1 else ''}"
-        else:
-            years = age_days // 365
-            return f"{years} year{'s' if years > 1 else ''}"
-    except:
+        created = date.fromisoformat(created_str[:10])
+    except ValueError:
         return "Unknown"
 
+    age_days = (today - created).days
+    return AGE_LABELS[bisect_right(AGE_BOUNDS, age_days)](age_days)
+
+
+def count_issues(client: Jira, jql: str) -> int:
+    """Return Jira's (approximate) count of issues matching ``jql``."""
+    result = client.post(COUNT_PATH, data={'jql': jql}) or {}
+    return result.get('count', 0)
+
+
+def _search_pages(client: Jira, jql: str, limit: int, fields: str, page_size: int) -> List[Dict[str, Any]]:
+    """Fetch up to ``limit`` issues matching ``jql`` with ``fields``, following page tokens."""
+    issues: List[Dict[str, Any]] = []
+    params: Dict[str, Any] = {'jql': jql, 'fields': fields}
+
+    while len(issues) < limit:
+        params['maxResults'] = min(page_size, limit - len(issues))
+        result = client.get(SEARCH_PATH, params=params) or {}
+        issues.extend(result.get('issues', []))
+        token = result.get('nextPageToken')
+        if result.get('isLast', True) or not token:
+            break
+        params['nextPageToken'] = token
+
+    return issues[:limit]
+
+
+def search_issue_keys(client: Jira, jql: str, limit: int) -> List[str]:
+    """List up to ``limit`` issue keys matching ``jql``, following page tokens."""
+    return [issue['key'] for issue in _search_pages(client, jql, limit, 'id', KEY_PAGE_SIZE)]
+
+
+def _fetch_batch(client: Jira, keys: List[str], fields: List[str]) -> List[Dict[str, Any]]:
+    """Fetch one batch of issues with a single JQL search."""
+    params = {
+        'jql': f"key in ({','.join(keys)})",
+        'fields': ','.join(fields),
+        'maxResults': BATCH_SIZE,
+    }
+    result = client.get(SEARCH_PATH, params=params) or {}
+    return result.get('issues', [])
+
 
 def search_tickets(
     client: Jira,
     jql: str,
-    limit: int = 50
-) -> List[Dict[str, Any]]:
-    """Search for tickets using JQL."""
-    fields = ['summary', 'status', 'priority', 'created', 'updated',
-              'issuetype', 'labels', 'description']
+    limit: int = 50,
+    fields: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Search for tickets using JQL.
+
+    The total match count comes from one count request, run alongside the
+    search. Up to BATCH_SIZE results (the default run) come straight from
+    one field-bearing search page. Larger limits list keys in cheap
+    key-only pages first, then fetch fields (DEFAULT_FIELDS unless given)
+    in batches of BATCH_SIZE on a small thread pool. ``limit=0`` only
+    counts.
+
+    Returns ``(issues, total)`` with issues in JQL order.
+    """
+    fields = fields or DEFAULT_FIELDS
+    if limit <= 0:
+        return [], count_issues(client, jql)
 
-    result = client.jql(jql, limit=limit, fields=fields)
-    return result.get('issues', [])
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        count = executor.submit(count_issues, client, jql)
+
+        if limit <= BATCH_SIZE:
+            issues = _search_pages(client, jql, limit, ','.join(fields), BATCH_SIZE)
+        else:
+            keys = search_issue_keys(client, jql, limit)
+            batches = [keys[start:start + BATCH_SIZE] for start in range(0, len(keys), BATCH_SIZE)]
+            results = executor.map(lambda batch: _fetch_batch(client, batch, fields), batches)
+            by_key = {issue['key']: issue for batch_issues in results for issue in batch_issues}
+            issues = [by_key[key] for key in keys if key in by_key]
+
+        # The count is approximate; never report fewer than were listed
+        total = max(count.result(), len(issues))
+
+    return issues, total
+
+
+def _field_name(fields: Dict[str, Any], field: str, default: str) -> str:
+    """Return ``fields[field]['name']``, or ``default`` if it is missing or null."""
+    try:
+        return fields[field]['name']
+    except (KeyError, TypeError):
+        return default
 
 
-def format_ticket_list(issues: List[Dict[str, Any]]) -> str:
-    """Format ticket list as human-readable text."""
+def iter_ticket_lines(issues: List[Dict[str, Any]], total: int, today: date) -> Iterator[str]:
+    """Yield the ticket list as human-readable lines, ages relative to ``today``.
+
+    ``total`` is the full match count; ``issues`` may be a limited prefix.
+    """
+    if not total:
+        yield "No tickets found matching criteria."
+        yield ""
+        return
+
     if not issues:
-        return "No tickets found matching criteria.\n"
+        # Count only (--limit 0)
+        yield f"\nFound {total} ticket(s) needing grooming.\n"
+        return
 
-    lines = []
-    lines.append(f"\nFound {len(issues)} ticket(s) needing grooming:\n")
-    lines.append(f"{'Key':<15} {'Age':<12} {'Priority':<10} {'Status':<20} {'Summary'}")
-    lines.append("-" * 120)
+    shown = f" (showing {len(issues)})" if len(issues) < total else ""
+    yield f"\nFound {total} ticket(s) needing grooming{shown}:\n"
+    yield f"{'Key':<15} {'Age':<12} {'Priority':<10} {'Status':<20} {'Summary'}"
+    yield "-" * 120
 
     for issue in issues:
         key = issue['key']
         fields = issue['fields']
 
-        summary = fields.get('summary', 'No summary')[:60]
-        priority = fields.get('priority', {}).get('name', 'None')
-        status = fields.get('status', {}).get('name', 'Unknown')
-        created = fields.get('created', '')
-        age = format_age(created)
-
-        lines.append(f"{key:<15} {age:<12} {priority:<10} {status:<20} {summary}")
+        summary = fields.get('summary')
+        if summary is None:
+            summary = 'No summary'
+        priority = _field_name(fields, 'priority', 'None')
+        status = _field_name(fields, 'status', 'Unknown')
+        age = format_age(fields.get('created'), today)
 
-    lines.append("")
-    lines.append("💡 Next Steps:")
-    lines.append("   1. Analyze individual tickets: uv run analyze_readiness.py <KEY>")
-    lines.append("   2. Prioritize HIGH severity gaps")
-    lines.append("   3. Schedule grooming sessions for tickets with missing context")
-    lines.append("")
+        yield f"{key:<15} {age:<12} {priority:<10} {status:<20} {summary[:60]}"
 
-    return "\n".join(lines)
+    yield ""
+    yield "💡 Next Steps:"
+    yield "   1. Analyze individual tickets: uv run analyze_readiness.py <KEY>"
+    yield "   2. Prioritize HIGH severity gaps"
+    yield "   3. Schedule grooming sessions for tickets with missing context"
+    yield ""
 
 
 @click.command()
@@ -222,10 +404,11 @@ def format_ticket_list(issues: List[Dict[str, Any]]) -> str:
 @click.option('--label', '-l', help='Filter by label (e.g., needs-grooming)')
 @click.option('--unestimated', '-u', is_flag=True, help='Only show tickets without story points')
 @click.option('--issue-type', '-t', help='Filter by issue type (overrides grooming filter)')
-@click.option('--limit', default=50, help='Maximum number of results (default: 50)')
+@click.option('--limit', default=50, help='Maximum number of results (default: 50, 0 for count only)')
 @click.option('--jql', help='Custom JQL query (overrides all other filters)')
+@click.option('--no-cache', is_flag=True, help=f'Skip cached results (cached for {CACHE_TTL}s)')
 def main(project: str, grooming_filter: bool, status: str, label: str,
-         unestimated: bool, issue_type: str, limit: int, jql: str):
+         unestimated: bool, issue_type: str, limit: int, jql: str, no_cache: bool):
     """
     Find tickets that need grooming before pointing.
 
@@ -244,10 +427,11 @@ def main(project: str, grooming_filter: bool, status: str, label: str,
 
         # Custom filters (disables grooming filter)
         uv run find_grooming_candidates.py --no-grooming-filter --status "Needs More Info"
+
+        # Bypass the short-lived result cache
+        uv run find_grooming_candidates.py --no-cache
     """
     try:
-        client = get_jira_client()
-
         # Build or use custom JQL
         if jql:
             query = jql
@@ -269,20 +453,26 @@ def main(project: str, grooming_filter: bool, status: str, label: str,
             )
             click.echo(f"JQL: {query}", err=True)
 
-        # Search tickets
-        click.echo("Searching...", err=True)
-        issues = search_tickets(client, query, limit=limit)
+        # Search tickets, reusing a fresh cached result when available
+        cached = None if no_cache else load_cache(query, limit, DEFAULT_FIELDS)
+        if cached:
+            click.echo(f"Using cached results ({int(time.time() - cached.timestamp)}s old)", err=True)
+            issues, total = cached.issues, cached.total
+        else:
+            client = get_jira_client()
+            click.echo("Searching...", err=True)
+            issues, total = search_tickets(client, query, limit=limit)
+            if not no_cache:
+                save_cache(query, limit, DEFAULT_FIELDS, issues, total)
 
         # Format and display
-        output = format_ticket_list(issues)
-        click.echo(output)
+        sys.stdout.writelines(f"{line}\n" for line in iter_ticket_lines(issues, total, date.today()))
 
         # Exit code: 0 if found tickets, 1 if none found
-        sys.exit(0 if issues else 1)
+        sys.exit(0 if total else 1)
 
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
-        import traceback
         traceback.print_exc()
         sys.exit(2)
 
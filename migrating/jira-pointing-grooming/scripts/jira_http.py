@@ -0,0 +1,38 @@
+"""
+Shared HTTP session setup for the Jira scripts in this directory.
+
+Scripts run with `uv run <script>.py`, which puts this directory on
+sys.path, so they import it as a sibling module. Its only dependencies
+(requests, urllib3) come in with atlassian-python-api.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Connections kept per host; covers each script's worker threads with headroom
+HTTP_POOL_SIZE = 16
+
+
+class RateLimitRetry(Retry):
+    """Retry idempotent requests on transient errors, and any request on 429.
+
+    A 429 means Jira rejected the request outright, so POSTs (comments,
+    transitions, count queries) are safe to resend; other POST failures are
+    not retried to avoid duplicate comments.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429 and self.total:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def build_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """Create an HTTP session sized for concurrent workers, with backoff."""
+    session = requests.Session()
+    retry = RateLimitRetry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
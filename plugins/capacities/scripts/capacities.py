@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["httpx"]
+# dependencies = ["httpx[http2]", "orjson"]
 # ///
 """
 Capacities API client for Claude Code.
@@ -38,16 +38,20 @@ Examples:
 """
 
 import argparse
+import atexit
+import functools
 import json
 import os
 import re
 import sys
+import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 # Constants
 API_BASE = "https://api.capacities.io"
@@ -60,9 +64,11 @@ CACHE_TTL = {
 
 @dataclass
 class CacheEntry:
-    """Cache entry with timestamp."""
+    """Cache entry with timestamp and the ETag it was served with."""
     data: Any
     timestamp: float
+    etag: str | None = None
+    stale: bool = False
 
 
 def get_token() -> str:
@@ -76,23 +82,30 @@ def get_token() -> str:
     return token
 
 
+@functools.lru_cache(maxsize=1)
 def get_client() -> httpx.Client:
-    """Create HTTP client with auth headers."""
-    return httpx.Client(
+    """Return the shared HTTP client, created with auth headers on first use.
+
+    Reusing one client keeps the connection (and its TLS session) alive
+    across requests; HTTP/2 lets concurrent requests share it.
+    """
+    client = httpx.Client(
         base_url=API_BASE,
         headers={
             "Authorization": f"Bearer {get_token()}",
             "Content-Type": "application/json",
         },
         timeout=30.0,
+        http2=True,
     )
+    atexit.register(client.close)
+    return client
 
 
 def request(method: str, path: str, operation: str, **kwargs: Any) -> httpx.Response:
     """Perform an HTTP request and handle network errors consistently."""
     try:
-        with get_client() as client:
-            return client.request(method, path, **kwargs)
+        return get_client().request(method, path, **kwargs)
     except httpx.RequestError as exc:
         print(f"Error: Network problem during {operation}: {exc}", file=sys.stderr)
         print("\nTroubleshooting:", file=sys.stderr)
@@ -106,49 +119,127 @@ def _cache_file(key: str) -> Path:
     return CACHE_DIR / f"{safe_key}.json"
 
 
-def load_cache(key: str) -> CacheEntry | None:
-    """Load cached data if valid."""
+def load_cache(key: str, allow_stale: bool = False) -> CacheEntry | None:
+    """Load cached data if valid.
+
+    With ``allow_stale``, expired entries are returned marked ``stale`` so
+    they can be revalidated with their ETag instead of refetched.
+    """
     cache_file = _cache_file(key)
     if not cache_file.exists():
         return None
 
     try:
-        data = json.loads(cache_file.read_text())
-        entry = CacheEntry(data=data["data"], timestamp=data["timestamp"])
+        data = orjson.loads(cache_file.read_bytes())
+        entry = CacheEntry(data=data["data"], timestamp=data["timestamp"], etag=data.get("etag"))
 
         # Check TTL
         # Extract base key: "spaces" or "space-info" from cache keys
         base_key = "space-info" if key.startswith("space-info-") else key
         ttl = CACHE_TTL.get(base_key, 300)
-        if time.time() - entry.timestamp > ttl:
+        entry.stale = time.time() - entry.timestamp > ttl
+        if entry.stale and not allow_stale:
             return None
-    except (json.JSONDecodeError, KeyError):
+    except (orjson.JSONDecodeError, KeyError):
         return None
     else:
         return entry
 
 
-def save_cache(key: str, data: Any) -> None:
+def save_cache(key: str, data: Any, etag: str | None = None) -> None:
     """Save data to cache."""
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     cache_file = _cache_file(key)
-    cache_file.write_text(json.dumps({
-        "data": data,
-        "timestamp": time.time(),
-    }))
+    # Write to a uniquely named file beside the target and rename it over the
+    # target, so an interrupted write never leaves a truncated cache file and
+    # concurrent writers of the same key never share a temp file
+    with tempfile.NamedTemporaryFile(dir=CACHE_DIR, prefix=f"{cache_file.stem}.",
+                                     suffix=".tmp", delete=False) as tmp:
+        tmp.write(orjson.dumps({
+            "data": data,
+            "timestamp": time.time(),
+            "etag": etag,
+        }))
+    os.replace(tmp.name, cache_file)
+
+
+def revalidation_headers(cached: CacheEntry | None) -> dict[str, str]:
+    """Conditional-GET headers for a stale cache entry, if it has an ETag."""
+    if cached and cached.etag:
+        return {"If-None-Match": cached.etag}
+    return {}
+
+
+def refresh_if_not_modified(response: httpx.Response, key: str, cached: CacheEntry | None) -> bool:
+    """On a 304, restart the cached entry's TTL and report that it is current."""
+    if response.status_code != 304 or cached is None:
+        return False
+    save_cache(key, cached.data, cached.etag)
+    return True
 
 
 def clear_cache() -> None:
     """Clear all cached data."""
     if CACHE_DIR.exists():
         for f in CACHE_DIR.glob("*.json"):
-            f.unlink()
+            f.unlink(missing_ok=True)
+        # Leftovers from writes that were interrupted before the rename
+        for f in CACHE_DIR.glob("*.tmp"):
+            f.unlink(missing_ok=True)
+
+
+def _ok(response: httpx.Response, headers: httpx.Headers, operation: str) -> dict | list | None:
+    if response.text:
+        return response.json()
+    return None
+
+
+def _unauthorized(response: httpx.Response, headers: httpx.Headers, operation: str) -> None:
+    print("Error: Unauthorized - check your CAPACITIES_API_TOKEN", file=sys.stderr)
+    sys.exit(1)
+
+
+def _rate_limited(response: httpx.Response, headers: httpx.Headers, operation: str) -> None:
+    reset = headers.get("RateLimit-Reset", "60")
+    print(f"Error: Rate limit exceeded. Try again in {reset} seconds.", file=sys.stderr)
+    sys.exit(1)
+
+
+def _bad_request(response: httpx.Response, headers: httpx.Headers, operation: str) -> None:
+    try:
+        error = response.json()
+        print(f"Error: Bad request - {error.get('message', response.text)}", file=sys.stderr)
+    except json.JSONDecodeError:
+        print(f"Error: Bad request - {response.text}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _not_found(response: httpx.Response, headers: httpx.Headers, operation: str) -> None:
+    print(f"Error: Not found - {operation}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _failed(response: httpx.Response, headers: httpx.Headers, operation: str) -> None:
+    print(f"Error: {operation} failed with status {response.status_code}", file=sys.stderr)
+    print(response.text, file=sys.stderr)
+    sys.exit(1)
+
+
+_STATUS_HANDLERS = {
+    200: _ok,
+    401: _unauthorized,
+    429: _rate_limited,
+    400: _bad_request,
+    404: _not_found,
+}
 
 
 def handle_response(response: httpx.Response, operation: str) -> dict | list | None:
     """Handle API response with error checking."""
+    headers = response.headers
+
     # Check rate limit headers
-    remaining = response.headers.get("RateLimit-Remaining")
+    remaining = headers.get("RateLimit-Remaining")
     if remaining:
         try:
             if int(remaining) <= 1:
@@ -156,31 +247,8 @@ def handle_response(response: httpx.Response, operation: str) -> dict | list | N
         except ValueError:
             pass  # Ignore malformed header
 
-    if response.status_code == 200:
-        if response.text:
-            return response.json()
-        return None
-    elif response.status_code == 401:
-        print("Error: Unauthorized - check your CAPACITIES_API_TOKEN", file=sys.stderr)
-        sys.exit(1)
-    elif response.status_code == 429:
-        reset = response.headers.get("RateLimit-Reset", "60")
-        print(f"Error: Rate limit exceeded. Try again in {reset} seconds.", file=sys.stderr)
-        sys.exit(1)
-    elif response.status_code == 400:
-        try:
-            error = response.json()
-            print(f"Error: Bad request - {error.get('message', response.text)}", file=sys.stderr)
-        except json.JSONDecodeError:
-            print(f"Error: Bad request - {response.text}", file=sys.stderr)
-        sys.exit(1)
-    elif response.status_code == 404:
-        print(f"Error: Not found - {operation}", file=sys.stderr)
-        sys.exit(1)
-    else:
-        print(f"Error: {operation} failed with status {response.status_code}", file=sys.stderr)
-        print(response.text, file=sys.stderr)
-        sys.exit(1)
+    handler = _STATUS_HANDLERS.get(response.status_code, _failed)
+    return handler(response, headers, operation)
 
 
 def format_spaces(spaces: list[dict], as_json: bool) -> None:
@@ -289,21 +357,25 @@ def format_saved(result: dict, as_json: bool, subject: str) -> None:
 
 def cmd_spaces(args: argparse.Namespace) -> None:
     """List all user spaces."""
-    # Try cache first
+    # Try cache first; a stale entry is revalidated with its ETag
+    cached = None
     if not args.no_cache:
-        cached = load_cache("spaces")
-        if cached:
+        cached = load_cache("spaces", allow_stale=True)
+        if cached and not cached.stale:
             format_spaces(cached.data, args.json)
             return
 
-    response = request("GET", "/spaces", "List spaces")
+    response = request("GET", "/spaces", "List spaces", headers=revalidation_headers(cached))
+    if refresh_if_not_modified(response, "spaces", cached):
+        format_spaces(cached.data, args.json)
+        return
     data = handle_response(response, "List spaces")
 
     spaces = data.get("spaces", []) if data else []
 
     # Cache result
     if not args.no_cache:
-        save_cache("spaces", spaces)
+        save_cache("spaces", spaces, response.headers.get("ETag"))
 
     format_spaces(spaces, args.json)
 
@@ -312,20 +384,24 @@ def cmd_space_info(args: argparse.Namespace) -> None:
     """Get structures and collections for a space."""
     cache_key = f"space-info-{args.space_id}"
 
-    # Try cache first
+    # Try cache first; a stale entry is revalidated with its ETag
+    cached = None
     if not args.no_cache:
-        cached = load_cache(cache_key)
-        if cached:
+        cached = load_cache(cache_key, allow_stale=True)
+        if cached and not cached.stale:
             format_space_info(cached.data, args.json)
             return
 
     response = request("GET", "/space-info", f"Get space info for {args.space_id}",
-                       params={"spaceid": args.space_id})
+                       params={"spaceid": args.space_id}, headers=revalidation_headers(cached))
+    if refresh_if_not_modified(response, cache_key, cached):
+        format_space_info(cached.data, args.json)
+        return
     data = handle_response(response, f"Get space info for {args.space_id}")
 
     # Cache result
     if not args.no_cache and data:
-        save_cache(cache_key, data)
+        save_cache(cache_key, data, response.headers.get("ETag"))
 
     format_space_info(data or {}, args.json)
 